@@ -2,12 +2,58 @@
 """Create actual Manim demo video"""
 
 import os
+import shutil
 import subprocess
+import sys
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
 
+@lru_cache(maxsize=None)
+def find_manim():
+    """Locate the manim executable on PATH (a stat, not a subprocess)"""
+    return shutil.which('manim')
+
+@lru_cache(maxsize=None)
+def manim_version():
+    """Installed manim version, read from package metadata without importing it"""
+    try:
+        return metadata.version('manim')
+    except metadata.PackageNotFoundError:
+        return None
+
 # Create Manim script directly
 manim_code = '''from manim import *
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Points closer than this to the pole are left where they are
+POLE_EPSILON = 0.01
+
+if njit is not None:
+    # Fused single pass over the points with no temporary arrays; cache=True
+    # keeps the compiled kernel on disk so re-renders skip the JIT warm-up
+    @njit(parallel=True, fastmath=True, cache=True)
+    def mobius_kernel(points, matrix, out):
+        a, b = matrix[0, 0], matrix[0, 1]
+        c, d = matrix[1, 0], matrix[1, 1]
+        for i in prange(points.shape[0]):
+            z = np.complex64(complex(points[i, 0], points[i, 1]))
+            denom = c * z + d
+            if abs(denom) > POLE_EPSILON:
+                w = (a * z + b) / denom
+                out[i, 0] = w.real
+                out[i, 1] = w.imag
+            else:
+                out[i, 0] = points[i, 0]
+                out[i, 1] = points[i, 1]
+            out[i, 2] = 0.0
+else:
+    mobius_kernel = None
+
 class MobiusTransformation(Scene):
     def construct(self):
         # Title
@@ -39,16 +85,18 @@ class MobiusTransformation(Scene):
         self.play(Write(condition))
         self.wait(2)
         
-        # Create grid inside disk
-        grid = NumberPlane(
-            x_range=[-3, 3, 0.5],
-            y_range=[-3, 3, 0.5],
-            background_line_style={
-                "stroke_color": GREY,
-                "stroke_width": 1,
-                "stroke_opacity": 0.5
-            }
-        )
+        # Create grid inside disk: every grid line lives in one VMobject, so
+        # all vertices sit in a single contiguous (N, 3) points array. Lines
+        # are sampled densely so they bend under the transformation.
+        line_pos, samples = np.mgrid[-3:3:13j, -3:3:61j]
+        zeros = np.zeros_like(line_pos)
+        vertical = np.stack([line_pos, samples, zeros], axis=-1)
+        horizontal = np.stack([samples, line_pos, zeros], axis=-1)
+        
+        grid = VMobject(stroke_color=GREY, stroke_width=1, stroke_opacity=0.5)
+        for polyline in np.concatenate([vertical, horizontal]):
+            grid.start_new_path(polyline[0])
+            grid.add_points_as_corners(polyline[1:])
         
         # Mask to show only inside disk
         mask = Circle(radius=3, color=BLACK, fill_opacity=1)
@@ -58,21 +106,58 @@ class MobiusTransformation(Scene):
         self.wait()
         
         # Apply Möbius transformation
-        def mobius_transform(point):
-            x, y, z = point
-            z_complex = complex(x, y)
-            
-            # Simple Möbius: rotation and scaling
-            # f(z) = (z + 0.5) / (0.5z + 1)
-            if abs(0.5 * z_complex + 1) > 0.01:
-                w = (z_complex + 0.5) / (0.5 * z_complex + 1)
-                return np.array([w.real, w.imag, 0])
-            else:
-                return point
+        # Simple Möbius: rotation and scaling
+        # f(z) = (z + 0.5) / (0.5z + 1), as the matrix [[a, b], [c, d]] acting
+        # on homogeneous [z, 1]^T, normalized to det 1 (SL(2, C)). Composing
+        # maps is then just a matrix product. Single precision (complex64) is
+        # ample for pixel output and halves the memory traffic.
+        a, b, c, d = 1, 0.5, 0.5, 1
+        mobius_matrix = np.array([[a, b], [c, d]], dtype=np.complex64)
+        mobius_matrix /= np.sqrt(np.linalg.det(mobius_matrix))
+
+        # Scratch arrays, allocated once for the grid and reused: the
+        # homogeneous rows [z, 1] and their image under the matrix
+        def mobius_buffers(n_points):
+            homog = np.ones((n_points, 2), dtype=np.complex64)
+            return homog, np.empty_like(homog)
         
-        # Animate transformation
+        grid_buffers = mobius_buffers(len(grid.points))
+
+        def mobius_transform(points):
+            # Evaluated over the whole (N, 3) array
+            if len(points) == len(grid_buffers[0]):
+                homog, image = grid_buffers
+            else:
+                homog, image = mobius_buffers(len(points))
+            # The output becomes the mobject's points, so it is never shared
+            # (float64, as Manim stores points)
+            out = np.empty((len(points), 3))
+            
+            if mobius_kernel is not None:
+                mobius_kernel(points, mobius_matrix, out)
+                return out
+            
+            z = homog[:, 0]
+            np.multiply(points[:, 1], 1j, out=z)
+            z += points[:, 0]
+            np.matmul(homog, mobius_matrix.T, out=image)
+            numer, denom = image[:, 0], image[:, 1]
+            # Branchless pole guard: divide by 1 near the pole, then keep z there
+            near_pole = np.abs(denom) <= POLE_EPSILON
+            np.copyto(denom, 1.0, where=near_pole)
+            np.divide(numer, denom, out=numer)
+            np.copyto(numer, z, where=near_pole)
+            out[:, 0] = numer.real
+            out[:, 1] = numer.imag
+            out[:, 2] = 0.0
+            return out
+
+        # Animate transformation (one call over the grid's whole point array,
+        # rather than one Python call per vertex as apply_function does)
         self.play(
-            grid.animate.apply_function(mobius_transform),
+            grid.animate.apply_points_function_about_point(
+                mobius_transform, about_point=ORIGIN
+            ),
             run_time=3
         )
         self.wait(2)
@@ -104,20 +189,27 @@ print("\nAttempting to render video...")
 print("Note: This requires Manim to be properly installed with all dependencies")
 
 # Check if manim is available
-try:
-    result = subprocess.run(['manim', '--version'], capture_output=True, text=True)
-    print(f"Manim version: {result.stdout}")
+manim_bin = find_manim()
+if manim_bin:
+    print(f"Manim version: {manim_version() or 'unknown'}")
     
     # Try to render
     cmd = [
-        'manim', '-ql', '-o', 'MobiusTransformation.mp4',
+        manim_bin, '-ql', '-o', 'MobiusTransformation.mp4',
         str(script_path), 'MobiusTransformation'
     ]
     
     print(f"\nRunning: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True, cwd=str(output_dir))
+    # Stream Manim's output as it renders instead of buffering it all
+    process = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        text=True, bufsize=1, cwd=str(output_dir)
+    )
+    for line in process.stdout:
+        sys.stdout.write(line)
+    process.wait()
     
-    if result.returncode == 0:
+    if process.returncode == 0:
         print(f"\n✅ Video successfully created!")
         print(f"Location: {video_path}")
         
@@ -126,10 +218,8 @@ try:
             size = video_path.stat().st_size / 1024 / 1024  # MB
             print(f"File size: {size:.2f} MB")
     else:
-        print(f"\n❌ Manim rendering failed:")
-        print(result.stderr)
-        
-except FileNotFoundError:
+        print(f"\n❌ Manim rendering failed (exit code {process.returncode})")
+else:
     print("\n❌ Manim is not installed or not in PATH")
     print("The script has been created but cannot be rendered without Manim")
 
@@ -6,6 +6,15 @@ This example demonstrates how to use Kimi K2 with other MCP tools
 for a complete mathematical research workflow.
 """
 
+import sys
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
 # Example workflow for investigating gyrovector properties
 
 async def gyrovector_research_workflow():
@@ -102,6 +111,19 @@ Generated Manim code saved to: {visualization.get('saved_to', 'N/A')}
         "collaboration": collaboration
     }
 
+def dump_results(results):
+    """Write workflow results to stdout as indented JSON"""
+    if ORJSON_AVAILABLE:
+        sys.stdout.buffer.write(orjson.dumps(
+            results,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        ))
+        sys.stdout.flush()
+    else:
+        print(json.dumps(results, indent=2, default=str))
+
 # Usage example:
 # results = await gyrovector_research_workflow()
-# print(json.dumps(results, indent=2))
+# dump_results(results)
+
@@ -1,38 +1,152 @@
 #!/usr/bin/env python
 """Launch all MCP servers"""
-import subprocess
+import asyncio
+import os
+import signal
 import sys
-import time
 from pathlib import Path
 
-def launch_servers():
+SERVERS = [
+    "src/launch_master.py",
+    "src/launch_discovery.py",
+    "src/launch_visualization.py",
+    "src/launch_ingestion.py"
+]
+
+# Every server logs "Starting <name>..." to stderr once it is up. That is an
+# INFO line, so with a higher LOG_LEVEL a server still running after the
+# grace period counts as ready too.
+READY_SENTINEL = b"Starting"
+READY_GRACE = 3.0
+READY_TIMEOUT = 30.0
+
+class SpawnedServer:
+    """Server process started with os.posix_spawn"""
+
+    def __init__(self, pid, stderr):
+        self.pid = pid
+        self.stderr = stderr
+        self.returncode = None
+
+    async def wait(self):
+        """Wait for the process to exit without blocking the event loop"""
+        _, status = await asyncio.to_thread(os.waitpid, self.pid, 0)
+        self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def poll(self):
+        """Exit code if the process has exited, else None, without blocking"""
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                return None  # Already reaped by a pending wait()
+            if pid:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def terminate(self):
+        """Send SIGTERM unless the process has already exited"""
+        if self.poll() is not None:
+            return
+        try:
+            os.kill(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+async def spawn_server(server):
+    """Start a server with its stderr piped back to us
+
+    posix_spawn avoids duplicating this interpreter's address space the way
+    fork() does; platforms without it fall back to asyncio subprocesses.
+    """
+    if not hasattr(os, "posix_spawn"):
+        return await asyncio.create_subprocess_exec(
+            sys.executable, server, stderr=asyncio.subprocess.PIPE
+        )
+
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawn(
+            sys.executable, [sys.executable, server], os.environ,
+            file_actions=[(os.POSIX_SPAWN_DUP2, write_fd, 2)]
+        )
+    except OSError:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
+
+    reader = asyncio.StreamReader()
+    loop = asyncio.get_running_loop()
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(read_fd, "rb", 0)
+    )
+    return SpawnedServer(pid, reader)
+
+async def relay_output(stream):
+    """Forward a server's stderr to ours"""
+    async for line in stream:
+        sys.stderr.buffer.write(line)
+        sys.stderr.flush()
+
+async def wait_ready(server, process):
+    """Wait until a server logs its startup line or outlives READY_GRACE"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + READY_GRACE
+    while True:
+        try:
+            line = await asyncio.wait_for(
+                process.stderr.readline(), max(0.0, deadline - loop.time())
+            )
+        except asyncio.TimeoutError:
+            return  # Quiet but still running
+        if not line:
+            raise RuntimeError(f"{server} exited before becoming ready")
+        sys.stderr.buffer.write(line)
+        sys.stderr.flush()
+        if READY_SENTINEL in line:
+            return
+
+async def launch_servers():
     """Launch all MCP servers in separate processes"""
-    servers = [
-        "src/launch_master.py",
-        "src/launch_discovery.py",
-        "src/launch_visualization.py",
-        "src/launch_ingestion.py"
-    ]
-    
     processes = []
-    
-    for server in servers:
-        print(f"Launching {server}...")
-        process = subprocess.Popen([sys.executable, server])
-        processes.append(process)
-        time.sleep(2)  # Give each server time to start
-    
-    print("All servers launched. Press Ctrl+C to stop.")
-    
+
     try:
+        for server in SERVERS:
+            print(f"Launching {server}...")
+            processes.append(await spawn_server(server))
+
+        # Probe all servers concurrently instead of sleeping between spawns
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(wait_ready(s, p) for s, p in zip(SERVERS, processes))),
+                timeout=READY_TIMEOUT
+            )
+            print("All servers launched. Press Ctrl+C to stop.")
+        except asyncio.TimeoutError:
+            print(f"Not all servers reported ready within {READY_TIMEOUT:.0f}s. Press Ctrl+C to stop.")
+        except RuntimeError as e:
+            print(f"Launch failed: {e}")
+            return
+
+        relays = [asyncio.create_task(relay_output(p.stderr)) for p in processes]
         # Wait for all processes
-        for process in processes:
-            process.wait()
-    except KeyboardInterrupt:
-        print("\nShutting down servers...")
-        for process in processes:
-            process.terminate()
-        print("All servers stopped.")
+        await asyncio.gather(*(p.wait() for p in processes))
+        await asyncio.gather(*relays)
+    finally:
+        running = [p for p in processes if p.returncode is None]
+        if running:
+            print("\nShutting down servers...")
+            for process in running:
+                try:
+                    process.terminate()
+                except ProcessLookupError:
+                    pass  # Exited since the returncode check
 
 if __name__ == "__main__":
-    launch_servers()
\ No newline at end of file
+    from src.launch import run
+    try:
+        run(launch_servers())
+    except KeyboardInterrupt:
+        print("All servers stopped.")
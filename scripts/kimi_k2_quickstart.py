@@ -17,6 +17,7 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
+    import aiofiles
     from src.servers.kimi_k2_integration import KimiK2Agent, KimiK2Config
     from dotenv import load_dotenv
 except ImportError as e:
@@ -65,6 +66,10 @@ EXAMPLES = {
     }
 }
 
+# Maximum number of benchmark queries / examples in flight at once
+BENCHMARK_CONCURRENCY = 5
+EXAMPLE_CONCURRENCY = 3
+
 class KimiK2QuickStart:
     def __init__(self):
         # Check for API key
@@ -79,71 +84,167 @@ class KimiK2QuickStart:
         self.config = KimiK2Config(groq_api_key=api_key)
         self.agent = KimiK2Agent(self.config)
         print("✅ Kimi K2 initialized successfully")
+        
+        # Example name -> coroutine that runs it
+        self.example_handlers = {
+            "basic_query": self._run_query_example,
+            "gyrovector_calculation": self._run_problem_example,
+            "lattice_problem": self._run_problem_example,
+            "recursive_harmonic": self._run_problem_example,
+            "orbifold": self._run_problem_example,
+            "visualization": self._run_visualization_example
+        }
+        
+        # Interactive command -> coroutine taking the rest of the input line
+        self.commands = {
+            "help": self._cmd_help,
+            "examples": self._cmd_examples,
+            "run": self.run_example,
+            "query": self._cmd_query,
+            "solve": self._cmd_solve,
+            "visualize": self._cmd_visualize
+        }
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        # One agent (and its pooled HTTPS connections) serves every request
+        await self.agent.aclose()
+    
+    async def _run_query_example(self, example):
+        return await self.agent.query(example["prompt"])
+    
+    async def _run_problem_example(self, example):
+        return await self.agent.solve_mathematical_problem(
+            problem=example["problem"],
+            domain=example["domain"],
+            validate=True
+        )
+    
+    async def _run_visualization_example(self, example):
+        result = await self.agent.generate_manim_code(
+            concept=example["concept"],
+            animation_type=example["animation_type"]
+        )
+        
+        # Save the generated code if successful
+        if result.get("status") == "success" and result.get("manim_code"):
+            output_dir = "generated_animations"
+            os.makedirs(output_dir, exist_ok=True)
+            
+            file_path = os.path.join(output_dir, result["file_name"])
+            async with aiofiles.open(file_path, "w") as f:
+                await f.write(result["manim_code"])
+            
+            # Reported with the rest of the result by _print_example_result
+            result["saved_to"] = file_path
+        
+        return result
     
     async def run_example(self, example_name: str):
         """Run a specific example"""
-        if example_name not in EXAMPLES:
+        if example_name not in self.example_handlers:
             print(f"❌ Unknown example: {example_name}")
             print(f"Available examples: {', '.join(EXAMPLES.keys())}")
             return
         
-        example = EXAMPLES[example_name]
+        self._print_example_header(example_name)
+        self._print_example_result(await self._execute_example(example_name))
+    
+    async def run_all_examples(self):
+        """Run every example concurrently, printing each one's output in order"""
+        # A few at a time to stay within the Groq rate limit
+        semaphore = asyncio.Semaphore(EXAMPLE_CONCURRENCY)
+        
+        async def run_bounded(example_name):
+            async with semaphore:
+                return await self._execute_example(example_name)
+        
+        results = await asyncio.gather(*(run_bounded(name) for name in EXAMPLES))
+        
+        # Printed only once all are done, so no two examples' output interleave
+        for example_name, result in zip(EXAMPLES, results):
+            self._print_example_header(example_name)
+            self._print_example_result(result)
+    
+    async def _execute_example(self, example_name: str):
+        """Run an example's handler; an exception is returned, not raised"""
+        try:
+            return await self.example_handlers[example_name](EXAMPLES[example_name])
+        except Exception as e:
+            return e
+    
+    def _print_example_header(self, example_name: str):
         print(f"\n{'='*60}")
-        print(f"Running: {example['description']}")
+        print(f"Running: {EXAMPLES[example_name]['description']}")
         print(f"{'='*60}\n")
+    
+    def _print_example_result(self, result):
+        if isinstance(result, Exception):
+            print(f"❌ Exception: {str(result)}")
+            return
         
-        try:
-            if example_name == "basic_query":
-                result = await self.agent.query(example["prompt"])
-                
-            elif example_name in ["gyrovector_calculation", "lattice_problem", 
-                                 "recursive_harmonic", "orbifold"]:
-                result = await self.agent.solve_mathematical_problem(
-                    problem=example["problem"],
-                    domain=example["domain"],
-                    validate=True
-                )
-                
-            elif example_name == "visualization":
-                result = await self.agent.generate_manim_code(
-                    concept=example["concept"],
-                    animation_type=example["animation_type"]
-                )
-                
-                # Save the generated code if successful
-                if result.get("status") == "success" and result.get("manim_code"):
-                    output_dir = "generated_animations"
-                    os.makedirs(output_dir, exist_ok=True)
-                    
-                    file_path = os.path.join(output_dir, result["file_name"])
-                    with open(file_path, "w") as f:
-                        f.write(result["manim_code"])
-                    
-                    print(f"✅ Manim code saved to: {file_path}")
-                    print("\nTo render the animation, run:")
-                    print(f"manim -pql {file_path}")
+        if result.get("saved_to"):
+            print(f"✅ Manim code saved to: {result['saved_to']}")
+            print("\nTo render the animation, run:")
+            print(f"manim -pql {result['saved_to']}")
+        
+        # Display results
+        if result.get("status") == "success":
+            print("✅ Success!\n")
+            print("Response:")
+            print("-" * 40)
+            print(result.get("content", "No content"))
             
-            # Display results
-            if result.get("status") == "success":
-                print("✅ Success!\n")
-                print("Response:")
+            if result.get("validation"):
+                print("\nValidation:")
                 print("-" * 40)
-                print(result.get("content", "No content"))
-                
-                if result.get("validation"):
-                    print("\nValidation:")
-                    print("-" * 40)
-                    print(result["validation"].get("content", "No validation content"))
-                
-                print(f"\nMetadata:")
-                print(f"- Duration: {result['metadata'].get('duration_ms', 'N/A')} ms")
-                print(f"- Tokens: {result['metadata'].get('tokens', {}).get('total', 'N/A')}")
-                
-            else:
-                print(f"❌ Error: {result.get('error', 'Unknown error')}")
-                
-        except Exception as e:
-            print(f"❌ Exception: {str(e)}")
+                print(result["validation"].get("content", "No validation content"))
+            
+            print(f"\nMetadata:")
+            print(f"- Duration: {result['metadata'].get('duration_ms', 'N/A')} ms")
+            print(f"- Tokens: {result['metadata'].get('tokens', {}).get('total', 'N/A')}")
+            
+        else:
+            print(f"❌ Error: {result.get('error', 'Unknown error')}")
+    
+    async def _cmd_help(self, _):
+        print("\nAvailable commands:")
+        print("- help: Show this help")
+        print("- examples: List available examples")
+        print("- run <example>: Run a specific example")
+        print("- query <prompt>: Send a custom query")
+        print("- solve <problem>: Solve a mathematical problem")
+        print("- visualize <concept>: Generate visualization code")
+        print("- exit: Quit\n")
+    
+    async def _cmd_examples(self, _):
+        print("\nAvailable examples:")
+        for name, example in EXAMPLES.items():
+            print(f"- {name}: {example['description']}")
+        print()
+    
+    async def _cmd_query(self, prompt):
+        result = await self.agent.query(prompt)
+        print(f"\n{result.get('content', 'No response')}\n")
+    
+    async def _cmd_solve(self, problem):
+        result = await self.agent.solve_mathematical_problem(problem)
+        print(f"\n{result.get('content', 'No solution')}\n")
+    
+    async def _cmd_visualize(self, concept):
+        result = await self.agent.generate_manim_code(concept)
+        if result.get("manim_code"):
+            print(f"\n✅ Generated Manim code for: {concept}")
+            print("Code preview:")
+            print("-" * 40)
+            print(result["manim_code"][:500] + "..." if len(result["manim_code"]) > 500 else result["manim_code"])
+        else:
+            print("❌ Failed to generate visualization code")
+    
+    async def _cmd_unknown(self, _):
+        print("Unknown command. Type 'help' for available commands.")
     
     async def interactive_mode(self):
         """Run in interactive mode"""
@@ -153,53 +254,16 @@ class KimiK2QuickStart:
         while True:
             try:
                 user_input = input("kimi> ").strip()
+                if not user_input:
+                    continue
                 
-                if user_input.lower() == "exit":
+                command, _, argument = user_input.partition(" ")
+                command = command.lower()
+                if command == "exit":
                     break
-                    
-                elif user_input.lower() == "help":
-                    print("\nAvailable commands:")
-                    print("- help: Show this help")
-                    print("- examples: List available examples")
-                    print("- run <example>: Run a specific example")
-                    print("- query <prompt>: Send a custom query")
-                    print("- solve <problem>: Solve a mathematical problem")
-                    print("- visualize <concept>: Generate visualization code")
-                    print("- exit: Quit\n")
-                    
-                elif user_input.lower() == "examples":
-                    print("\nAvailable examples:")
-                    for name, example in EXAMPLES.items():
-                        print(f"- {name}: {example['description']}")
-                    print()
-                    
-                elif user_input.startswith("run "):
-                    example_name = user_input[4:].strip()
-                    await self.run_example(example_name)
-                    
-                elif user_input.startswith("query "):
-                    prompt = user_input[6:].strip()
-                    result = await self.agent.query(prompt)
-                    print(f"\n{result.get('content', 'No response')}\n")
-                    
-                elif user_input.startswith("solve "):
-                    problem = user_input[6:].strip()
-                    result = await self.agent.solve_mathematical_problem(problem)
-                    print(f"\n{result.get('content', 'No solution')}\n")
-                    
-                elif user_input.startswith("visualize "):
-                    concept = user_input[10:].strip()
-                    result = await self.agent.generate_manim_code(concept)
-                    if result.get("manim_code"):
-                        print(f"\n✅ Generated Manim code for: {concept}")
-                        print("Code preview:")
-                        print("-" * 40)
-                        print(result["manim_code"][:500] + "..." if len(result["manim_code"]) > 500 else result["manim_code"])
-                    else:
-                        print("❌ Failed to generate visualization code")
-                    
-                elif user_input:
-                    print("Unknown command. Type 'help' for available commands.")
+                
+                handler = self.commands.get(command, self._cmd_unknown)
+                await handler(argument.strip())
                     
             except KeyboardInterrupt:
                 print("\n\nExiting...")
@@ -222,10 +286,19 @@ class KimiK2QuickStart:
         total_time = 0
         total_tokens = 0
         
-        for i, query in enumerate(test_queries, 1):
+        # Queries are network-bound, so issue them concurrently
+        semaphore = asyncio.Semaphore(BENCHMARK_CONCURRENCY)
+        
+        async def run_query(query):
+            async with semaphore:
+                return await self.agent.query(query)
+        
+        start_time = datetime.now()
+        results = await asyncio.gather(*(run_query(q) for q in test_queries))
+        wall_time = (datetime.now() - start_time).total_seconds() * 1000
+        
+        for i, (query, result) in enumerate(zip(test_queries, results), 1):
             print(f"\nQuery {i}/{len(test_queries)}: {query[:50]}...")
-            result = await self.agent.query(query)
-            
             if result.get("status") == "success":
                 duration = result["metadata"].get("duration_ms", 0)
                 tokens = result["metadata"].get("tokens", {}).get("total", 0)
@@ -242,6 +315,7 @@ class KimiK2QuickStart:
             tokens_per_second = (total_tokens / total_time) * 1000 if total_time > 0 else 0
             
             print(f"\n📊 Benchmark Results:")
+            print(f"- Wall-clock time: {wall_time:.2f}ms")
             print(f"- Average response time: {avg_time:.2f}ms")
             print(f"- Total tokens processed: {total_tokens}")
             print(f"- Tokens per second: {tokens_per_second:.2f}")
@@ -250,41 +324,37 @@ class KimiK2QuickStart:
 
 async def main():
     """Main entry point"""
-    quickstart = KimiK2QuickStart()
-    
-    print("\n🎯 Kimi K2 Integration Quick Start")
-    print("==================================\n")
+    async with KimiK2QuickStart() as quickstart:
+        print("\n🎯 Kimi K2 Integration Quick Start")
+        print("==================================\n")
     
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
+        if len(sys.argv) > 1:
+            command = sys.argv[1]
         
-        if command == "benchmark":
-            await quickstart.benchmark_performance()
+            if command == "benchmark":
+                await quickstart.benchmark_performance()
             
-        elif command == "interactive":
-            await quickstart.interactive_mode()
+            elif command == "interactive":
+                await quickstart.interactive_mode()
             
-        elif command in EXAMPLES:
-            await quickstart.run_example(command)
+            elif command in EXAMPLES:
+                await quickstart.run_example(command)
             
-        elif command == "all":
-            # Run all examples
-            for example_name in EXAMPLES:
-                await quickstart.run_example(example_name)
-                await asyncio.sleep(1)  # Brief pause between examples
+            elif command == "all":
+                await quickstart.run_all_examples()
+            else:
+                print(f"Unknown command: {command}")
+                print("\nUsage:")
+                print("  python kimi_k2_quickstart.py [command]")
+                print("\nCommands:")
+                print("  benchmark    - Run performance benchmark")
+                print("  interactive  - Start interactive mode")
+                print("  all         - Run all examples")
+                print("  <example>   - Run specific example")
+                print(f"\nExamples: {', '.join(EXAMPLES.keys())}")
         else:
-            print(f"Unknown command: {command}")
-            print("\nUsage:")
-            print("  python kimi_k2_quickstart.py [command]")
-            print("\nCommands:")
-            print("  benchmark    - Run performance benchmark")
-            print("  interactive  - Start interactive mode")
-            print("  all         - Run all examples")
-            print("  <example>   - Run specific example")
-            print(f"\nExamples: {', '.join(EXAMPLES.keys())}")
-    else:
-        # Default: run interactive mode
-        await quickstart.interactive_mode()
+            # Default: run interactive mode
+            await quickstart.interactive_mode()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -4,7 +4,7 @@ Quick Start: Run Manim GitHub Discovery Swarm
 This script demonstrates how to use MCP tools to discover Manim patterns
 """
 
-import json
+import sys
 from datetime import datetime
 
 def run_manim_discovery():
@@ -117,17 +117,22 @@ ingest_to_obsidian(
         }
     ]
     
-    # Print commands for manual execution
-    print("Execute these commands in Claude Desktop:\n")
+    # Print commands for manual execution, in a single write
+    separator = "-" * 40
+    lines = ["Execute these commands in Claude Desktop:\n"]
     
     for i, cmd in enumerate(commands, 1):
-        print(f"Step {i}: {cmd['step']}")
-        print(f"Purpose: {cmd['purpose']}")
-        print(f"Command:")
-        print("-" * 40)
-        print(cmd['command'])
-        print("-" * 40)
-        print()
+        lines.extend([
+            f"Step {i}: {cmd['step']}",
+            f"Purpose: {cmd['purpose']}",
+            "Command:",
+            separator,
+            cmd['command'],
+            separator,
+            ""
+        ])
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Additional workflow for specific concepts
     print("\n" + "="*60)
@@ -153,16 +158,19 @@ ingest_to_obsidian(
         ]
     }
     
+    lines = []
     for concept, searches in advanced_workflows.items():
-        print(f"\n{concept}:")
-        for search in searches:
-            print(f"  - {search}")
+        lines.append(f"\n{concept}:")
+        lines.extend(f"  - {search}" for search in searches)
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Create batch processing script
     batch_script = """
 # Batch Discovery Script
 # Run this to discover patterns for multiple concepts
 
+import json
+
 concepts = ["gyrovector", "stereographic", "topology", "mobius"]
 all_patterns = []
 
@@ -10,16 +10,74 @@ Usage:
 import argparse
 import asyncio
 import json
+import logging
+from collections import Counter
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add src to path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from manim_swarm import ManimSwarm, run_manim_swarm
 
+def _dumps(obj) -> bytes:
+    """Serialize a single JSON value to bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def write_report(path: str, header: dict, patterns) -> None:
+    """Stream the discovery report to disk one pattern at a time
+
+    Only one pattern's summary is held in memory at once, rather than the
+    whole report plus its serialized form.
+    """
+    with open(path, "wb") as f:
+        f.write(b"{\n")
+        for key, value in header.items():
+            f.write(b"  " + _dumps(key) + b": " + _dumps(value) + b",\n")
+        
+        f.write(b'  "patterns": [')
+        separator = b"\n    "
+        for p in patterns:
+            f.write(separator)
+            f.write(_dumps({
+                "id": p.pattern_id,
+                "concept": p.mathematical_concept,
+                "source": p.source_url,
+                "quality": p.quality_score,
+                "reusability": p.reusability
+            }))
+            separator = b",\n    "
+        f.write(b"\n  ]\n}\n")
+
+async def run_batch(concepts, max_concurrency: int = 4):
+    """Discover patterns for several concepts concurrently in one event loop"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def discover(concept):
+        async with semaphore:
+            print(f"\n{'='*60}")
+            print(f"Discovering: {concept.upper()}")
+            print('='*60)
+            
+            return await run_manim_swarm(concept, deploy_full=False)
+    
+    results = await asyncio.gather(*(discover(c) for c in concepts))
+    return list(chain.from_iterable(results))
+
 def main():
+    # The swarm reports its progress through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     parser = argparse.ArgumentParser(
         description="Deploy the Manim Swarm to discover animation patterns from GitHub"
     )
@@ -78,17 +136,7 @@ def main():
         print("📦 Running BATCH DISCOVERY for common concepts...")
         
         batch_concepts = ["gyrovector", "topology", "geometry", "calculus"]
-        all_patterns = []
-        
-        for concept in batch_concepts:
-            print(f"\n{'='*60}")
-            print(f"Discovering: {concept.upper()}")
-            print('='*60)
-            
-            patterns = asyncio.run(run_manim_swarm(concept, deploy_full=False))
-            all_patterns.extend(patterns)
-        
-        patterns = all_patterns
+        patterns = asyncio.run(run_batch(batch_concepts))
         
     elif args.concept:
         print(f"🔍 Searching for {args.concept.upper()} patterns...")
@@ -102,26 +150,15 @@ def main():
     
     # Generate report
     if patterns:
-        report = {
+        header = {
             "deployment_date": datetime.now().isoformat(),
             "mode": "full-scan" if args.full_scan else "batch" if args.batch else "single",
             "concept": args.concept if args.concept else "multiple",
-            "patterns_discovered": len(patterns),
-            "patterns": [
-                {
-                    "id": p.pattern_id,
-                    "concept": p.mathematical_concept,
-                    "source": p.source_url,
-                    "quality": p.quality_score,
-                    "reusability": p.reusability
-                }
-                for p in patterns
-            ]
+            "patterns_discovered": len(patterns)
         }
         
         # Save report
-        with open(args.output, "w") as f:
-            json.dump(report, f, indent=2)
+        write_report(args.output, header, patterns)
         
         print(f"\n✅ Report saved to: {args.output}")
         
@@ -148,28 +185,31 @@ def main():
         print("DISCOVERY SUMMARY")
         print("="*60)
         
-        # Count by concept
-        concept_counts = {}
+        # Count by concept, quality band and reusability in one pass
+        concept_counts = Counter()
+        high_quality = medium_quality = low_quality = 0
+        high_reuse = 0
         for p in patterns:
-            concept = p.mathematical_concept
-            concept_counts[concept] = concept_counts.get(concept, 0) + 1
+            concept_counts[p.mathematical_concept] += 1
+            if p.quality_score >= 0.8:
+                high_quality += 1
+            elif p.quality_score >= 0.6:
+                medium_quality += 1
+            else:
+                low_quality += 1
+            if p.reusability == "high":
+                high_reuse += 1
         
         print("\nPatterns by Concept:")
-        for concept, count in sorted(concept_counts.items(), key=lambda x: x[1], reverse=True):
+        for concept, count in concept_counts.most_common():
             print(f"  • {concept}: {count}")
         
-        # Quality distribution
-        high_quality = sum(1 for p in patterns if p.quality_score >= 0.8)
-        medium_quality = sum(1 for p in patterns if 0.6 <= p.quality_score < 0.8)
-        low_quality = sum(1 for p in patterns if p.quality_score < 0.6)
-        
         print(f"\nQuality Distribution:")
         print(f"  • High Quality (≥0.8): {high_quality}")
         print(f"  • Medium Quality (0.6-0.8): {medium_quality}")
         print(f"  • Low Quality (<0.6): {low_quality}")
         
         # Reusability
-        high_reuse = sum(1 for p in patterns if p.reusability == "high")
         print(f"\nHighly Reusable Patterns: {high_reuse}/{len(patterns)}")
         
     else:
@@ -64,6 +64,19 @@ else
     echo "   - Ubuntu: sudo apt install ffmpeg libcairo2-dev"
 fi
 
+# Optionally compile the discovery swarm to a C extension (COMPILE_EXTENSIONS=1)
+if [ "$COMPILE_EXTENSIONS" = "1" ]; then
+    echo "Compiling manim_discovery_swarm with mypyc..."
+    pip install mypy
+    # src/ is a package, so pin the module base to src/ itself; otherwise
+    # mypyc names the module src.manim_discovery_swarm and cannot install it
+    if (cd src && MYPYPATH=. mypyc --explicit-package-bases manim_discovery_swarm.py); then
+        echo "✓ Compiled src/manim_discovery_swarm (delete the .so to go back to pure Python)"
+    else
+        echo "⚠️  mypyc compilation failed; the pure-Python module will be used"
+    fi
+fi
+
 # Display Claude Desktop configuration instructions
 echo ""
 echo "=========================================="
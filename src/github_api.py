@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+GitHub API helpers shared by the Manim swarms
+One aiohttp session per swarm run, with rate-limit aware retries
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+GITHUB_SEARCH_URL = "https://api.github.com/search/repositories"
+MAX_RETRIES = 4
+MAX_RETRY_DELAY = 60.0
+
+def open_session(limit: int) -> "aiohttp.ClientSession":
+    """Pooled GitHub API session, authenticated when GITHUB_TOKEN is set"""
+    headers = {"Accept": "application/vnd.github+json"}
+    token = os.getenv("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=limit, ttl_dns_cache=300),
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=10)
+    )
+
+def retry_delay(headers, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited GitHub request"""
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    if headers.get("X-RateLimit-Remaining") == "0" and headers.get("X-RateLimit-Reset"):
+        return max(0.0, float(headers["X-RateLimit-Reset"]) - datetime.now().timestamp())
+    return min(float(2 ** attempt), MAX_RETRY_DELAY)
+
+async def github_get(session: "aiohttp.ClientSession", url: str,
+                     params: Optional[Dict] = None, limiter=None) -> Dict:
+    """GET a GitHub API URL, optionally under an async rate limiter
+
+    Rate-limited responses (403/429) are retried after the delay GitHub
+    asks for, or with exponential backoff capped at MAX_RETRY_DELAY. When
+    GitHub asks for a longer wait than MAX_RETRY_DELAY (e.g. until an
+    hourly quota resets), the request fails instead of sleeping.
+    """
+    attempt = 0
+    while True:
+        async with limiter or contextlib.nullcontext():
+            async with session.get(url, params=params) as response:
+                delay = None
+                if response.status in (403, 429) and attempt < MAX_RETRIES:
+                    delay = retry_delay(response.headers, attempt)
+                if delay is None or delay > MAX_RETRY_DELAY:
+                    response.raise_for_status()
+                    return await response.json()
+        logger.warning("Rate limited by GitHub, retrying in %.0fs", delay)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+async def search_repositories(session: "aiohttp.ClientSession", query: str,
+                              limiter=None) -> List[Dict]:
+    """Search GitHub repositories for a swarm query
+
+    Results are dicts with url, title, description and stars.
+    """
+    params = {"q": query.replace("site:github.com", "").strip(), "per_page": 10}
+    data = await github_get(session, GITHUB_SEARCH_URL, params, limiter)
+    return [
+        {
+            "url": item["html_url"],
+            "title": item["full_name"],
+            "description": item.get("description") or "",
+            "stars": item.get("stargazers_count", 0)
+        }
+        for item in data.get("items", [])
+    ]
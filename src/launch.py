@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""Launch a single MCP server by agent name"""
+import argparse
+import importlib
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Agent name -> server module exposing an async main()
+AGENTS = {
+    "master": "src.servers.master_coordinator",
+    "discovery": "src.servers.research_discovery",
+    "visualization": "src.servers.mathematical_visualization",
+    "ingestion": "src.servers.knowledge_ingestion"
+}
+
+def run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    import asyncio
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    return asyncio.run(coro)
+
+def launch(agent: str):
+    """Import the agent's server module and run it
+
+    The import is deferred to here so that only the chosen server's
+    dependencies are loaded, and --help stays cheap.
+    """
+    server = importlib.import_module(AGENTS[agent])
+    run(server.main())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Launch a Dobbs-MCP server")
+    parser.add_argument("--agent", choices=list(AGENTS), required=True,
+                        help="Which server to launch")
+    launch(parser.parse_args().agent)
@@ -4,8 +4,6 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.servers.knowledge_ingestion import main
-
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
\ No newline at end of file
+    from src.launch import launch
+    launch("ingestion")
\ No newline at end of file
@@ -4,8 +4,6 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.servers.mathematical_visualization import main
-
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
\ No newline at end of file
+    from src.launch import launch
+    launch("visualization")
\ No newline at end of file
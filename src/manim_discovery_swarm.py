@@ -7,12 +7,97 @@ Discovers and catalogs Manim animation patterns from GitHub repositories
 import json
 import re
 import asyncio
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+import numpy as np
+from typing import Dict, Final, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate, chain
+from pathlib import Path
 import hashlib
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+from github_api import open_session, search_repositories
+
+MAX_CONCURRENT_REQUESTS = 10
+GITHUB_RATE_LIMIT = 10  # requests per second
+_SEARCH_PREFIX = "site:github.com manim"
+
+class _TokenBucket:
+    """Async token bucket: at most `rate` acquisitions per `period` seconds, no bursts beyond `rate`"""
+    
+    def __init__(self, rate: float, period: float = 1.0) -> None:
+        self.rate = rate
+        self.period = period
+        self._tokens = rate
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    refill = (now - self._updated) * self.rate / self.period
+                    self._tokens = min(self.rate, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+    
+    async def __aenter__(self) -> "_TokenBucket":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+
+# Title keyword -> concept, in priority order
+_CONCEPT_KEYWORDS = {
+    "gyrovector": "Gyrovector Operations",
+    "stereographic": "Stereographic Projection",
+    "mobius": "Möbius Transformation",
+    "manifold": "Manifold Visualization",
+    "topology": "Topological Structures",
+    "hyperbolic": "Hyperbolic Geometry",
+    "clifford": "Clifford Algebra",
+    "lie": "Lie Groups and Algebras"
+}
+_CONCEPT_PRIORITY = {keyword: i for i, keyword in enumerate(_CONCEPT_KEYWORDS)}
+_CONCEPT_RE = re.compile("|".join(re.escape(k) for k in _CONCEPT_KEYWORDS))
+
+_CONCEPT_TAGS = {
+    "Gyrovector": ["gyrovector", "hyperbolic", "poincare"],
+    "Stereographic": ["projection", "topology", "manifold"],
+    "Möbius": ["transformation", "complex", "conformal"]
+}
+
+@lru_cache(maxsize=4096)
+def _pattern_id(url: str, concept: str) -> str:
+    """Stable 8-hex-digit ID for a (url, concept) pair"""
+    return hashlib.blake2b(f"{url}|{concept}".encode(), digest_size=4).hexdigest()
+
+_BASE_TAGS = ("manim", "animation", "mathematics")
+_BASE_DEPENDENCIES = ("manim>=0.17.0",)
+
+_IMPORT_RE = re.compile(r'from (\w+) import|import (\w+)')
+_IGNORED_IMPORTS = frozenset(["manim", "math", "os", "sys"])
+
+@dataclass(slots=True, frozen=True)
 class ManimPattern:
     """Represents a discovered Manim animation pattern"""
     pattern_id: str
@@ -20,14 +105,15 @@ class ManimPattern:
     mathematical_concept: str
     code_snippet: str
     description: str
-    tags: List[str]
+    tags: Tuple[str, ...]
     quality_score: float
     reusability: str
-    dependencies: List[str]
+    dependencies: Tuple[str, ...]
     discovered_at: str
     
     def to_obsidian_note(self) -> str:
         """Convert pattern to Obsidian note format"""
+        hashtags = "#" + " #".join(self.tags) if self.tags else ""
         return f"""# Manim Pattern: {self.mathematical_concept}
 
 ## Overview
@@ -49,7 +135,7 @@ class ManimPattern:
 {', '.join(self.dependencies)}
 
 ## Tags
-{' '.join([f'#{tag}' for tag in self.tags])}
+{hashtags}
 
 ## Related Patterns
 - [[Manim Pattern Catalog]]
@@ -57,76 +143,199 @@ class ManimPattern:
 """
 
 
+# Example code per concept (mock extraction), built once at import
+_CODE_EXAMPLES: Final[Dict[str, str]] = {
+    "Gyrovector Operations": """
+class GyrovectorAnimation(Scene):
+    def construct(self):
+        # Poincaré disk model
+        disk = Circle(radius=2, color=WHITE)
+        
+        # Gyrovector addition
+        u = np.array([0.3, 0.4, 0])
+        v = np.array([0.1, 0.2, 0])
+        
+        # Einstein velocity addition formula
+        w = self.einstein_add(u, v)
+        
+        # Visualize vectors
+        u_arrow = Arrow(ORIGIN, u*2, color=BLUE)
+        v_arrow = Arrow(ORIGIN, v*2, color=GREEN)
+        w_arrow = Arrow(ORIGIN, w*2, color=RED)
+        
+        self.play(Create(disk))
+        self.play(Create(u_arrow), Create(v_arrow))
+        self.play(Transform(VGroup(u_arrow, v_arrow), w_arrow))
+    
+    def einstein_add(self, u, v):
+        c = 1  # Speed of light normalized
+        u_dot_v = np.dot(u, v)
+        gamma_u = 1 / np.sqrt(1 - np.dot(u, u)/c**2)
+        
+        numerator = u + v/gamma_u + u_dot_v * u / (c**2 * (1 + gamma_u))
+        denominator = 1 + u_dot_v / c**2
+        
+        return numerator / denominator
+""",
+    "Stereographic Projection": """
+class StereographicProjection(ThreeDScene):
+    def construct(self):
+        # Create sphere
+        sphere = Sphere(radius=2, resolution=(30, 30))
+        sphere.set_color(BLUE_E)
+        
+        # Projection plane
+        plane = Square(side_length=6).rotate(PI/2, RIGHT)
+        plane.shift(3*DOWN)
+        
+        # North pole
+        north_pole = Dot3D(point=np.array([0, 0, 2]), color=RED)
+        
+        # Stereographic projection function
+        def project_point(p):
+            x, y, z = p
+            if z >= 1.99:  # Near north pole
+                return np.array([0, 0, -3])
+            factor = 1 / (1 - z/2)
+            return np.array([factor * x, factor * y, -3])
+        
+        # Animate projection
+        self.play(Create(sphere), Create(plane), Create(north_pole))
+        
+        # Project sample points
+        sample_points = sphere.get_all_points()[::50]
+        projections = VGroup(*[
+            Line3D(north_pole.get_center(), project_point(p), color=YELLOW)
+            for p in sample_points
+        ])
+        
+        self.play(Create(projections), run_time=3)
+"""
+}
+
+
 class ManimDiscoverySwarm:
     """Swarm system for discovering Manim patterns across GitHub"""
     
-    def __init__(self):
-        self.discovered_patterns = []
+    def __init__(self) -> None:
+        self.discovered_patterns: List[ManimPattern] = []
         self.search_queries = self._initialize_search_queries()
         self.quality_thresholds = {
             "min_stars": 5,
             "min_documentation_ratio": 0.1,
             "min_code_quality": 0.6
         }
+        # Caps concurrent GitHub searches / fetches (GitHub allows ~10 req/s)
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Paces requests so the gather fan-out never bursts past the rate limit
+        self._github_limiter = _TokenBucket(GITHUB_RATE_LIMIT)
+        self._session: Optional["aiohttp.ClientSession"] = None
     
-    def _initialize_search_queries(self) -> Dict[str, List[str]]:
-        """Initialize search queries for different mathematical concepts"""
+    async def __aenter__(self) -> "ManimDiscoverySwarm":
+        """Open one pooled HTTP session shared by every request in the swarm"""
+        if AIOHTTP_AVAILABLE:
+            self._session = open_session(limit=20)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def _initialize_search_queries(self) -> Dict[str, Tuple[str, ...]]:
+        """Initialize search query suffixes for different mathematical concepts"""
         return {
-            "gyrovector": [
-                "site:github.com manim gyrovector",
-                "site:github.com manim gyroaddition visualization",
-                "site:github.com manim poincare disk animation",
-                "site:github.com manim hyperbolic geometry"
-            ],
-            "topology": [
-                "site:github.com manim manifold visualization",
-                "site:github.com manim topology animation",
-                "site:github.com manim fiber bundle",
-                "site:github.com manim homology"
-            ],
-            "geometry": [
-                "site:github.com manim stereographic projection",
-                "site:github.com manim mobius transformation",
-                "site:github.com manim conformal mapping",
-                "site:github.com manim differential geometry"
-            ],
-            "algebra": [
-                "site:github.com manim group theory visualization",
-                "site:github.com manim lie algebra",
-                "site:github.com manim clifford algebra",
-                "site:github.com manim representation theory"
-            ]
+            "gyrovector": (
+                "gyrovector",
+                "gyroaddition visualization",
+                "poincare disk animation",
+                "hyperbolic geometry"
+            ),
+            "topology": (
+                "manifold visualization",
+                "topology animation",
+                "fiber bundle",
+                "homology"
+            ),
+            "geometry": (
+                "stereographic projection",
+                "mobius transformation",
+                "conformal mapping",
+                "differential geometry"
+            ),
+            "algebra": (
+                "group theory visualization",
+                "lie algebra",
+                "clifford algebra",
+                "representation theory"
+            )
         }
     
+    def queries(self, category: str) -> Iterator[str]:
+        """Lazily yield the full search queries for one category"""
+        return (f"{_SEARCH_PREFIX} {suffix}" for suffix in self.search_queries.get(category, ()))
+    
     async def discover_patterns(self, category: str = "all") -> List[ManimPattern]:
         """Main discovery process"""
         patterns = []
         
         # Select queries based on category
-        if category == "all":
-            queries = [q for queries in self.search_queries.values() for q in queries]
-        else:
-            queries = self.search_queries.get(category, [])
+        categories = list(self.search_queries) if category == "all" else [category]
+        queries = chain.from_iterable(self.queries(c) for c in categories)
         
         print(f"Starting discovery for category: {category}")
-        print(f"Total queries to process: {len(queries)}")
-        
-        for query in queries:
-            print(f"\nSearching: {query}")
-            results = await self._search_github(query)
-            
-            for result in results:
-                pattern = await self._analyze_result(result)
-                if pattern and self._meets_quality_threshold(pattern):
-                    patterns.append(pattern)
-                    print(f"✓ Discovered pattern: {pattern.mathematical_concept}")
+        print(f"Total queries to process: {sum(len(self.search_queries.get(c, ())) for c in categories)}")
+        
+        # One timestamp for the whole run; patterns in a batch share it
+        now_iso = datetime.now().isoformat()
+        
+        # Fan out searches, then analyses, bounded by the request semaphore
+        async def search(query: str) -> List[Dict]:
+            async with self._request_semaphore:
+                print(f"\nSearching: {query}")
+                return await self._search_github(query)
+        
+        async def analyze(result: Dict) -> Optional[ManimPattern]:
+            async with self._request_semaphore:
+                return await self._analyze_result(result, score=False, discovered_at=now_iso)
+        
+        results_per_query = await asyncio.gather(*(search(q) for q in queries))
+        
+        # Skip repositories that an earlier query of this call already
+        # returned, before paying for the fetch
+        seen_urls: Set[str] = set()
+        results = []
+        for result in (r for rs in results_per_query for r in rs):
+            if result["url"] not in seen_urls:
+                seen_urls.add(result["url"])
+                results.append(result)
+        
+        analyzed = await asyncio.gather(*(analyze(r) for r in results))
+        candidates = [(r, p) for r, p in zip(results, analyzed) if p]
+        
+        # Score every candidate in one vectorized pass and scan all of their
+        # code for imports in one regex pass
+        codes = [p.code_snippet for _, p in candidates]
+        scores = self._calculate_quality_scores_batch([r for r, _ in candidates], codes)
+        dependencies = self._extract_dependencies_batch(codes)
+        for (_, pattern), score, deps in zip(candidates, scores, dependencies):
+            pattern = replace(pattern, quality_score=float(score), dependencies=deps)
+            if self._meets_quality_threshold(pattern):
+                patterns.append(pattern)
+                print(f"✓ Discovered pattern: {pattern.mathematical_concept}")
         
         self.discovered_patterns.extend(patterns)
         return patterns
     
     async def _search_github(self, query: str) -> List[Dict]:
-        """Simulate GitHub search (would use web_search in real implementation)"""
-        # In actual implementation, this would use web_search tool
+        """Search GitHub repositories
+
+        Queries the GitHub search API over the shared session when the swarm
+        is used as an async context manager; otherwise returns mock results.
+        """
+        if self._session is not None:
+            return await search_repositories(self._session, query, self._github_limiter)
+        
         # For demonstration, returning mock results
         mock_results = [
             {
@@ -138,8 +347,14 @@ class ManimDiscoverySwarm:
         ]
         return mock_results
     
-    async def _analyze_result(self, result: Dict) -> Optional[ManimPattern]:
-        """Analyze a search result and extract pattern if valuable"""
+    async def _analyze_result(self, result: Dict, score: bool = True,
+                              discovered_at: Optional[str] = None) -> Optional[ManimPattern]:
+        """Analyze a search result and extract pattern if valuable
+
+        With score=False the pattern's quality_score and dependencies are left
+        empty for the caller to fill in from batch passes. discovered_at lets a
+        batch share one timestamp instead of reading the clock per pattern.
+        """
         # In real implementation, would fetch actual code using web_fetch
         # For demonstration, creating example pattern
         
@@ -159,120 +374,36 @@ class ManimDiscoverySwarm:
             code_snippet=code_snippet,
             description=result.get("description", ""),
             tags=self._extract_tags(concept, code_snippet),
-            quality_score=self._calculate_quality_score(result, code_snippet),
+            quality_score=self._calculate_quality_score(result, code_snippet) if score else 0.0,
             reusability=self._assess_reusability(code_snippet),
-            dependencies=self._extract_dependencies(code_snippet),
-            discovered_at=datetime.now().isoformat()
+            dependencies=self._extract_dependencies(code_snippet) if score else (),
+            discovered_at=discovered_at or datetime.now().isoformat()
         )
     
     def _extract_mathematical_concept(self, result: Dict) -> Optional[str]:
         """Extract the mathematical concept from search result"""
         title = result.get("title", "").lower()
-        concepts = {
-            "gyrovector": "Gyrovector Operations",
-            "stereographic": "Stereographic Projection",
-            "mobius": "Möbius Transformation",
-            "manifold": "Manifold Visualization",
-            "topology": "Topological Structures",
-            "hyperbolic": "Hyperbolic Geometry",
-            "clifford": "Clifford Algebra",
-            "lie": "Lie Groups and Algebras"
-        }
         
-        for keyword, concept in concepts.items():
-            if keyword in title:
-                return concept
-        return None
+        # One scan for all keywords; the highest-priority keyword wins
+        matches = _CONCEPT_RE.findall(title)
+        if not matches:
+            return None
+        return _CONCEPT_KEYWORDS[min(matches, key=_CONCEPT_PRIORITY.__getitem__)]
     
     def _generate_pattern_id(self, url: str, concept: str) -> str:
         """Generate unique pattern ID"""
-        hash_input = f"{url}_{concept}_{datetime.now().date()}"
-        return hashlib.md5(hash_input.encode()).hexdigest()[:8]
+        return _pattern_id(url, concept)
     
     def _extract_code_example(self, concept: str) -> str:
         """Extract relevant code example (mock implementation)"""
-        examples = {
-            "Gyrovector Operations": """
-class GyrovectorAnimation(Scene):
-    def construct(self):
-        # Poincaré disk model
-        disk = Circle(radius=2, color=WHITE)
-        
-        # Gyrovector addition
-        u = np.array([0.3, 0.4, 0])
-        v = np.array([0.1, 0.2, 0])
-        
-        # Einstein velocity addition formula
-        w = self.einstein_add(u, v)
-        
-        # Visualize vectors
-        u_arrow = Arrow(ORIGIN, u*2, color=BLUE)
-        v_arrow = Arrow(ORIGIN, v*2, color=GREEN)
-        w_arrow = Arrow(ORIGIN, w*2, color=RED)
-        
-        self.play(Create(disk))
-        self.play(Create(u_arrow), Create(v_arrow))
-        self.play(Transform(VGroup(u_arrow, v_arrow), w_arrow))
-    
-    def einstein_add(self, u, v):
-        c = 1  # Speed of light normalized
-        u_dot_v = np.dot(u, v)
-        gamma_u = 1 / np.sqrt(1 - np.dot(u, u)/c**2)
-        
-        numerator = u + v/gamma_u + u_dot_v * u / (c**2 * (1 + gamma_u))
-        denominator = 1 + u_dot_v / c**2
-        
-        return numerator / denominator
-""",
-            "Stereographic Projection": """
-class StereographicProjection(ThreeDScene):
-    def construct(self):
-        # Create sphere
-        sphere = Sphere(radius=2, resolution=(30, 30))
-        sphere.set_color(BLUE_E)
-        
-        # Projection plane
-        plane = Square(side_length=6).rotate(PI/2, RIGHT)
-        plane.shift(3*DOWN)
-        
-        # North pole
-        north_pole = Dot3D(point=np.array([0, 0, 2]), color=RED)
-        
-        # Stereographic projection function
-        def project_point(p):
-            x, y, z = p
-            if z >= 1.99:  # Near north pole
-                return np.array([0, 0, -3])
-            factor = 1 / (1 - z/2)
-            return np.array([factor * x, factor * y, -3])
-        
-        # Animate projection
-        self.play(Create(sphere), Create(plane), Create(north_pole))
-        
-        # Project sample points
-        sample_points = sphere.get_all_points()[::50]
-        projections = VGroup(*[
-            Line3D(north_pole.get_center(), project_point(p), color=YELLOW)
-            for p in sample_points
-        ])
-        
-        self.play(Create(projections), run_time=3)
-"""
-        }
-        return examples.get(concept, "# No example available")
+        return _CODE_EXAMPLES.get(concept, "# No example available")
     
-    def _extract_tags(self, concept: str, code: str) -> List[str]:
+    def _extract_tags(self, concept: str, code: str) -> Tuple[str, ...]:
         """Extract relevant tags"""
-        tags = ["manim", "animation", "mathematics"]
+        tags = [*_BASE_TAGS]
         
         # Add concept-specific tags
-        concept_tags = {
-            "Gyrovector": ["gyrovector", "hyperbolic", "poincare"],
-            "Stereographic": ["projection", "topology", "manifold"],
-            "Möbius": ["transformation", "complex", "conformal"]
-        }
-        
-        for key, value in concept_tags.items():
+        for key, value in _CONCEPT_TAGS.items():
             if key in concept:
                 tags.extend(value)
         
@@ -284,30 +415,30 @@ class StereographicProjection(ThreeDScene):
         if "VGroup" in code:
             tags.append("grouping")
         
-        return list(set(tags))
+        return tuple(dict.fromkeys(tags))
     
     def _calculate_quality_score(self, result: Dict, code: str) -> float:
         """Calculate quality score based on various factors"""
-        score = 0.5  # Base score
+        return float(self._calculate_quality_scores_batch([result], [code])[0])
+    
+    def _calculate_quality_scores_batch(self, results: List[Dict], codes: List[str]) -> np.ndarray:
+        """Calculate quality scores for many results at once"""
+        n = len(results)
+        scores = np.full(n, 0.5)  # Base score
         
         # Repository popularity
-        stars = result.get("stars", 0)
-        if stars > 100:
-            score += 0.2
-        elif stars > 50:
-            score += 0.1
-        elif stars > 10:
-            score += 0.05
-        
-        # Code quality indicators
-        if "def " in code and "class " in code:
-            score += 0.1  # Well-structured
-        if code.count("\n") > 20:
-            score += 0.1  # Substantial example
-        if "#" in code or '"""' in code:
-            score += 0.1  # Has comments/documentation
-        
-        return min(score, 1.0)
+        stars = np.fromiter((r.get("stars", 0) for r in results), dtype=float, count=n)
+        scores += np.select([stars > 100, stars > 50, stars > 10], [0.2, 0.1, 0.05], 0.0)
+        
+        # Code quality indicators; each adds 0.1, in the same order as before
+        # so the floating-point sums match the scalar scoring exactly
+        well_structured = np.fromiter(("def " in c and "class " in c for c in codes), dtype=bool, count=n)
+        substantial = np.fromiter((c.count("\n") > 20 for c in codes), dtype=bool, count=n)
+        documented = np.fromiter(("#" in c or '"""' in c for c in codes), dtype=bool, count=n)
+        for feature in (well_structured, substantial, documented):
+            scores += np.where(feature, 0.1, 0.0)
+        
+        return np.minimum(scores, 1.0)
     
     def _assess_reusability(self, code: str) -> str:
         """Assess how reusable the pattern is"""
@@ -317,17 +448,25 @@ class StereographicProjection(ThreeDScene):
             return "medium"
         return "low"
     
-    def _extract_dependencies(self, code: str) -> List[str]:
+    def _extract_dependencies(self, code: str) -> Tuple[str, ...]:
         """Extract required dependencies from code"""
-        dependencies = ["manim>=0.17.0"]
-        
-        imports = re.findall(r'from (\w+) import|import (\w+)', code)
-        for imp in imports:
-            dep = imp[0] or imp[1]
-            if dep not in ["manim", "math", "os", "sys"]:
-                dependencies.append(dep)
-        
-        return list(set(dependencies))
+        return self._extract_dependencies_batch([code])[0]
+    
+    def _extract_dependencies_batch(self, codes: List[str]) -> List[Tuple[str, ...]]:
+        """Extract dependencies for many code snippets in one regex scan
+
+        The snippets are joined with newlines (no import statement spans
+        one) and each match is attributed to its snippet by offset.
+        """
+        starts = list(accumulate((len(code) + 1 for code in codes[:-1]), initial=0))
+        dependencies: List[List[str]] = [[*_BASE_DEPENDENCIES] for _ in codes]
+        
+        for match in _IMPORT_RE.finditer("\n".join(codes)):
+            dep = match.group(1) or match.group(2)
+            if dep not in _IGNORED_IMPORTS:
+                dependencies[bisect_right(starts, match.start()) - 1].append(dep)
+        
+        return [tuple(dict.fromkeys(deps)) for deps in dependencies]
     
     def _meets_quality_threshold(self, pattern: ManimPattern) -> bool:
         """Check if pattern meets quality thresholds"""
@@ -335,7 +474,7 @@ class StereographicProjection(ThreeDScene):
     
     def generate_catalog(self) -> Dict[str, List[ManimPattern]]:
         """Generate categorized catalog of discovered patterns"""
-        catalog = {}
+        catalog: Dict[str, List[ManimPattern]] = {}
         
         for pattern in self.discovered_patterns:
             # Categorize by mathematical concept
@@ -346,19 +485,29 @@ class StereographicProjection(ThreeDScene):
         
         return catalog
     
-    def export_to_obsidian(self, vault_path: str = "Manim_Patterns"):
-        """Export discovered patterns to Obsidian vault structure"""
+    def _build_catalog_index(self) -> str:
+        """Render the catalog index note"""
         catalog = self.generate_catalog()
         
-        # Create catalog index
-        index_content = "# Manim Pattern Catalog\n\n"
-        index_content += f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
-        index_content += f"Total patterns discovered: {len(self.discovered_patterns)}\n\n"
+        parts = [
+            "# Manim Pattern Catalog\n\n",
+            f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n",
+            f"Total patterns discovered: {len(self.discovered_patterns)}\n\n"
+        ]
         
         for category, patterns in catalog.items():
-            index_content += f"\n## {category}\n"
-            for pattern in patterns:
-                index_content += f"- [[{pattern.pattern_id}]] - {pattern.mathematical_concept}\n"
+            parts.append(f"\n## {category}\n")
+            parts.extend(
+                f"- [[{pattern.pattern_id}]] - {pattern.mathematical_concept}\n"
+                for pattern in patterns
+            )
+        
+        return "".join(parts)
+    
+    def export_to_obsidian(self, vault_path: str = "Manim_Patterns"):
+        """Export discovered patterns to Obsidian vault structure"""
+        # Create catalog index
+        index_content = self._build_catalog_index()
         
         print("\n=== Obsidian Export ===")
         print(index_content)
@@ -368,7 +517,28 @@ class StereographicProjection(ThreeDScene):
             print(f"\n--- Pattern: {pattern.pattern_id} ---")
             print(pattern.to_obsidian_note())
     
-    def generate_enhanced_templates(self) -> Dict[str, str]:
+    async def export_to_obsidian_async(self, vault_path: str = "Manim_Patterns") -> List[Path]:
+        """Write the catalog index and every pattern note into vault_path
+
+        All files are written concurrently rather than one after another.
+        """
+        import aiofiles  # type: ignore[import-untyped]
+        
+        vault = Path(vault_path)
+        vault.mkdir(parents=True, exist_ok=True)
+        
+        notes = {vault / "Manim Pattern Catalog.md": self._build_catalog_index()}
+        for pattern in self.discovered_patterns:
+            notes[vault / f"{pattern.pattern_id}.md"] = pattern.to_obsidian_note()
+        
+        async def write_note(path: Path, content: str) -> Path:
+            async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+                await f.write(content)
+            return path
+        
+        return await asyncio.gather(*(write_note(p, c) for p, c in notes.items()))
+    
+    def generate_enhanced_templates(self) -> Dict[str, Dict]:
         """Generate enhanced templates for math-animator agent"""
         templates = {}
         
@@ -385,7 +555,7 @@ class StereographicProjection(ThreeDScene):
         return templates
 
 
-async def run_discovery_swarm(categories: List[str] = None):
+async def run_discovery_swarm(categories: Optional[List[str]] = None):
     """Run the Manim discovery swarm"""
     swarm = ManimDiscoverySwarm()
     
@@ -427,7 +597,10 @@ async def run_discovery_swarm(categories: List[str] = None):
     }
     
     print("\n=== Discovery Report ===")
-    print(json.dumps(report, indent=2))
+    if ORJSON_AVAILABLE:
+        print(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(report, indent=2))
     
     return swarm, report
 
@@ -6,203 +6,382 @@ Uses MCP web_search to find real Manim examples across GitHub
 
 import json
 import re
-from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Compiled once at import rather than looked up in re's cache per call
+_GITHUB_RE = re.compile(r'(https://github\.com/[\w-]+/[\w-]+(?:/[\w/-]+)?)')
+_SCENE_RE = re.compile(r'class\s+(\w+)\s*\(\s*(?:Three)?(?:D)?Scene\s*\)')
+_IMPORT_RE = re.compile(r'from manim import (.+)|import manim')
+_CLASS_START_RE = re.compile(r'class\s+\w+')
+_COMMENT_RE = re.compile(r'#\s*(.+)')
+
+_ANIMATION_METHODS = (
+    "Create", "Transform", "FadeIn", "FadeOut", "Rotate",
+    "Scale", "Shift", "MoveToTarget", "ApplyMethod",
+    "AnimationGroup", "Succession", "Write", "ShowCreation"
+)
+# One scan for every method name; no name contains another, so a single
+# non-overlapping pass finds the same names as a substring test per method
+_ANIMATION_METHODS_RE = re.compile("|".join(_ANIMATION_METHODS))
+
+_MATH_CONCEPTS = {
+    "gyrovector": ["gyro", "poincare", "hyperbolic"],
+    "projection": ["project", "stereographic", "orthogonal"],
+    "transformation": ["transform", "mobius", "conformal"],
+    "topology": ["manifold", "bundle", "homology"],
+    "geometry": ["euclidean", "riemannian", "differential"]
+}
+_KEYWORD_CONCEPTS = {kw: concept for concept, kws in _MATH_CONCEPTS.items() for kw in kws}
+_KEYWORDS = tuple(_KEYWORD_CONCEPTS)
+# Case-insensitive, so the code needs no lowercased copy
+_MATH_KEYWORDS_RE = re.compile("|".join(_KEYWORD_CONCEPTS), re.IGNORECASE)
+
+def _build_keyword_database():
+    """Compile the method names and concept keywords into one Hyperscan database
+
+    Pattern ids index _ANIMATION_METHODS first, then the keywords.
+    """
+    methods = [re.escape(m).encode() for m in _ANIMATION_METHODS]
+    keywords = [re.escape(kw).encode() for kw in _KEYWORDS]
+    flags = (
+        [hyperscan.HS_FLAG_SINGLEMATCH] * len(methods)
+        + [hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_CASELESS] * len(keywords)
+    )
+    database = hyperscan.Database()
+    database.compile(
+        expressions=methods + keywords,
+        ids=list(range(len(methods) + len(keywords))),
+        elements=len(methods) + len(keywords),
+        flags=flags
+    )
+    return database
+
+_KEYWORD_DATABASE = _build_keyword_database() if HYPERSCAN_AVAILABLE else None
+
+def _match_keywords(code: str) -> Tuple[List[str], List[str]]:
+    """Animation methods and mathematical concepts mentioned in code
+
+    Uses a single Hyperscan pass over the source when hyperscan is
+    installed, otherwise the two compiled alternations.
+    """
+    if _KEYWORD_DATABASE is not None:
+        hits = set()
+        _KEYWORD_DATABASE.scan(
+            code.encode(), match_event_handler=lambda pattern_id, start, end, flags, context: hits.add(pattern_id)
+        )
+        n_methods = len(_ANIMATION_METHODS)
+        used = {_ANIMATION_METHODS[i] for i in hits if i < n_methods}
+        matched = {_KEYWORD_CONCEPTS[_KEYWORDS[i - n_methods]] for i in hits if i >= n_methods}
+    else:
+        used = set(_ANIMATION_METHODS_RE.findall(code))
+        matched = {_KEYWORD_CONCEPTS[kw.lower()] for kw in _MATH_KEYWORDS_RE.findall(code)}
+    
+    return (
+        [method for method in _ANIMATION_METHODS if method in used],
+        [concept for concept in _MATH_CONCEPTS if concept in matched]
+    )
+
+# Search queries per focus area, built once at import
+_BASE_QUERIES: Dict[str, Tuple[str, ...]] = {
+    "gyrovector": (
+        'site:github.com "from manim import" gyrovector',
+        'site:github.com "class.*Scene" gyroaddition filetype:py',
+        'site:github.com manim "poincare disk" animation',
+        'site:github.com manim hyperbolic geometry visualization'
+    ),
+    "stereographic": (
+        'site:github.com "from manim import" "stereographic projection"',
+        'site:github.com manim "S3 sphere" projection filetype:py',
+        'site:github.com manim stereographic animation code'
+    ),
+    "topology": (
+        'site:github.com manim manifold visualization filetype:py',
+        'site:github.com "from manim import" topology',
+        'site:github.com manim "fiber bundle" animation',
+        'site:github.com manim homotopy visualization'
+    ),
+    "mobius": (
+        'site:github.com manim "mobius transformation" filetype:py',
+        'site:github.com manim conformal mapping animation',
+        'site:github.com "from manim import" mobius'
+    ),
+    "examples": (
+        'site:github.com path:examples manim mathematical',
+        'site:github.com "manim examples" geometry',
+        'site:github.com inurl:manim-examples mathematical'
+    ),
+    "educational": (
+        'site:github.com manim tutorial mathematical animations',
+        'site:github.com "learning manim" geometry examples',
+        'site:github.com manim course mathematical visualization'
+    )
+}
+
+def dumps_json(obj) -> str:
+    """Pretty-print obj as JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Concept names callers pass to extract_reusable_pattern
+_KNOWN_CONCEPTS = frozenset(_MATH_CONCEPTS) | frozenset(_BASE_QUERIES)
+
+def _build_concept_automaton():
+    """Aho-Corasick automaton over the known concept names"""
+    automaton = ahocorasick.Automaton()
+    for concept in _KNOWN_CONCEPTS:
+        automaton.add_word(concept, concept)
+    automaton.make_automaton()
+    return automaton
+
+_CONCEPT_AUTOMATON = _build_concept_automaton() if AHOCORASICK_AVAILABLE else None
+
+@lru_cache(maxsize=64)
+def _concepts_in(code: str) -> frozenset:
+    """Known concepts appearing in code (case-insensitive), found in one pass
+
+    Cached so checking one file against several concepts lowercases and
+    scans it only once.
+    """
+    code_lower = code.lower()
+    if _CONCEPT_AUTOMATON is not None:
+        return frozenset(concept for _, concept in _CONCEPT_AUTOMATON.iter(code_lower))
+    return frozenset(concept for concept in _KNOWN_CONCEPTS if concept in code_lower)
+
+def _mentions_concept(code: str, concept: str) -> bool:
+    """Whether concept occurs in the lowercased code"""
+    if concept in _KNOWN_CONCEPTS:
+        return concept in _concepts_in(code)
+    return concept in code.lower()
+
+@dataclass(slots=True, frozen=True)
+class RepoInfo:
+    """A GitHub URL found in search output"""
+    url: str
+    description: str
+    type: str
+    repo: str
+    discovered_at: str
+    
+    def __getitem__(self, key: str):
+        """Mapping-style access, for code written against the old result dicts"""
+        return getattr(self, key)
+    
+    def as_dict(self) -> Dict[str, str]:
+        """Plain dict copy, e.g. for JSON output"""
+        return asdict(self)
+
+def _first_class_block(code: str) -> Optional[str]:
+    """First class definition in code, up to the next class or blank line
+
+    Finds the end with str.find instead of a lazy DOTALL regex, which
+    re-tested its lookahead at every character of long blocks.
+    """
+    match = _CLASS_START_RE.search(code)
+    if not match:
+        return None
+    ends = [i for i in (code.find('\nclass', match.end()), code.find('\n\n', match.end())) if i != -1]
+    return code[match.start():min(ends, default=len(code))]
+
+@lru_cache(maxsize=512)
+def _analyze_code_snippet(code: str) -> Dict:
+    """Analyze a code snippet for Manim patterns (memoized; callers copy)"""
+    analysis = {
+        "has_manim_import": False,
+        "scene_classes": [],
+        "animation_methods": [],
+        "mathematical_concepts": [],
+        "complexity": "low",
+        "educational_value": "unknown"
+    }
+    
+    # Check for Manim imports; without one there are no Manim patterns
+    # to find, so skip the remaining scans
+    if "from manim import" in code or "import manim" in code:
+        analysis["has_manim_import"] = True
+    else:
+        return analysis
+    
+    # Find Scene classes
+    scenes = _SCENE_RE.findall(code)
+    analysis["scene_classes"] = scenes
+    
+    # Find animation methods and detect mathematical concepts
+    found_methods, found_concepts = _match_keywords(code)
+    analysis["animation_methods"] = found_methods
+    analysis["mathematical_concepts"] = found_concepts
+    
+    # Assess complexity
+    line_count = code.count('\n')
+    if line_count > 100 and len(found_methods) > 5:
+        analysis["complexity"] = "high"
+    elif line_count > 50 or len(found_methods) > 3:
+        analysis["complexity"] = "medium"
+    
+    # Educational value (heuristic)
+    if any(marker in code for marker in ["#", "'''", '"""', "NOTE:", "TODO:"]):
+        if line_count > 30:
+            analysis["educational_value"] = "high"
+        else:
+            analysis["educational_value"] = "medium"
+    
+    return analysis
+
 class ManimGitHubSearcher:
     """Search GitHub for Manim animation examples and patterns"""
     
+    __slots__ = ("search_results", "discovered_repos", "pattern_library")
+    
     def __init__(self):
-        self.search_results = []
+        self.search_results: List[RepoInfo] = []
         self.discovered_repos = []
         self.pattern_library = {}
         
     def get_search_queries(self, focus_area: str = "all") -> List[str]:
         """Generate optimized search queries for GitHub"""
-        
-        base_queries = {
-            "gyrovector": [
-                'site:github.com "from manim import" gyrovector',
-                'site:github.com "class.*Scene" gyroaddition filetype:py',
-                'site:github.com manim "poincare disk" animation',
-                'site:github.com manim hyperbolic geometry visualization'
-            ],
-            "stereographic": [
-                'site:github.com "from manim import" "stereographic projection"',
-                'site:github.com manim "S3 sphere" projection filetype:py',
-                'site:github.com manim stereographic animation code'
-            ],
-            "topology": [
-                'site:github.com manim manifold visualization filetype:py',
-                'site:github.com "from manim import" topology',
-                'site:github.com manim "fiber bundle" animation',
-                'site:github.com manim homotopy visualization'
-            ],
-            "mobius": [
-                'site:github.com manim "mobius transformation" filetype:py',
-                'site:github.com manim conformal mapping animation',
-                'site:github.com "from manim import" mobius'
-            ],
-            "examples": [
-                'site:github.com path:examples manim mathematical',
-                'site:github.com "manim examples" geometry',
-                'site:github.com inurl:manim-examples mathematical'
-            ],
-            "educational": [
-                'site:github.com manim tutorial mathematical animations',
-                'site:github.com "learning manim" geometry examples',
-                'site:github.com manim course mathematical visualization'
-            ]
-        }
-        
+        return list(self.get_search_queries_iter(focus_area))
+    
+    def get_search_queries_iter(self, focus_area: str = "all") -> Iterator[str]:
+        """Lazily yield the search queries for a focus area"""
         if focus_area == "all":
-            return [q for queries in base_queries.values() for q in queries]
+            return chain.from_iterable(_BASE_QUERIES.values())
         else:
-            return base_queries.get(focus_area, [])
+            return iter(_BASE_QUERIES.get(focus_area, ()))
     
-    def parse_search_results(self, search_output: str) -> List[Dict]:
+    def parse_search_results(self, search_output: str) -> List[RepoInfo]:
         """Parse web_search results to extract GitHub repositories"""
         repos = []
+        seen = set()
+        line_start = -1
+        now_iso = datetime.now().isoformat()
         
-        # Extract GitHub URLs and descriptions
-        github_pattern = r'(https://github\.com/[\w-]+/[\w-]+(?:/[\w/-]+)?)'
-        
-        for line in search_output.split('\n'):
-            match = re.search(github_pattern, line)
-            if match:
-                url = match.group(1)
-                
-                # Try to extract surrounding context as description
-                description = line.strip()
-                
-                repo_info = {
-                    "url": url,
-                    "description": description,
-                    "type": self._classify_url(url),
-                    "discovered_at": datetime.now().isoformat()
-                }
-                
-                # Avoid duplicates
-                if not any(r["url"] == url for r in repos):
-                    repos.append(repo_info)
+        # Extract GitHub URLs and descriptions in one scan of the whole
+        # output; the enclosing line is only sliced out for actual matches.
+        # The pattern's literal "https://github.com/" prefix lets re skip
+        # ahead between URLs as fast as a plain substring search, so text
+        # without links needs no separate "github.com" prefilter.
+        for match in _GITHUB_RE.finditer(search_output):
+            start = search_output.rfind('\n', 0, match.start()) + 1
+            if start == line_start:
+                continue  # Only the first URL on each line counts
+            line_start = start
+            url = match.group(1)
+            parts = url.split("/", 5)
+            
+            # Try to extract surrounding context as description
+            end = search_output.find('\n', match.end())
+            description = search_output[start:end if end != -1 else None].strip()
+            
+            repo_info = RepoInfo(
+                url=url,
+                description=description,
+                type=self._classify_url(url, parts),
+                repo="/".join(parts[:5]),
+                discovered_at=now_iso
+            )
+            
+            # Avoid duplicates
+            if url not in seen:
+                seen.add(url)
+                repos.append(repo_info)
         
         return repos
     
-    def _classify_url(self, url: str) -> str:
-        """Classify the type of GitHub URL"""
+    def _classify_url(self, url: str, parts: Optional[List[str]] = None) -> str:
+        """Classify the type of GitHub URL
+
+        parts is url.split("/", 5), when the caller has already split it.
+        """
         if "/blob/" in url or url.endswith(".py"):
             return "file"
         elif "/tree/" in url or "/examples" in url:
             return "directory"
-        elif url.count("/") == 4:  # Basic repo URL
+        elif len(parts or url.split("/", 5)) == 5:  # Basic repo URL
             return "repository"
         else:
             return "other"
     
     def analyze_code_snippet(self, code: str) -> Dict:
-        """Analyze a code snippet for Manim patterns"""
-        analysis = {
-            "has_manim_import": False,
-            "scene_classes": [],
-            "animation_methods": [],
-            "mathematical_concepts": [],
-            "complexity": "low",
-            "educational_value": "unknown"
-        }
-        
-        # Check for Manim imports
-        if "from manim import" in code or "import manim" in code:
-            analysis["has_manim_import"] = True
-        
-        # Find Scene classes
-        scene_pattern = r'class\s+(\w+)\s*\(\s*(?:Three)?(?:D)?Scene\s*\)'
-        scenes = re.findall(scene_pattern, code)
-        analysis["scene_classes"] = scenes
-        
-        # Find animation methods
-        animation_methods = [
-            "Create", "Transform", "FadeIn", "FadeOut", "Rotate",
-            "Scale", "Shift", "MoveToTarget", "ApplyMethod",
-            "AnimationGroup", "Succession", "Write", "ShowCreation"
-        ]
-        found_methods = []
-        for method in animation_methods:
-            if method in code:
-                found_methods.append(method)
-        analysis["animation_methods"] = found_methods
-        
-        # Detect mathematical concepts
-        math_concepts = {
-            "gyrovector": ["gyro", "poincare", "hyperbolic"],
-            "projection": ["project", "stereographic", "orthogonal"],
-            "transformation": ["transform", "mobius", "conformal"],
-            "topology": ["manifold", "bundle", "homology"],
-            "geometry": ["euclidean", "riemannian", "differential"]
-        }
-        
-        found_concepts = []
-        code_lower = code.lower()
-        for concept, keywords in math_concepts.items():
-            if any(keyword in code_lower for keyword in keywords):
-                found_concepts.append(concept)
-        analysis["mathematical_concepts"] = found_concepts
-        
-        # Assess complexity
-        line_count = code.count('\n')
-        if line_count > 100 and len(found_methods) > 5:
-            analysis["complexity"] = "high"
-        elif line_count > 50 or len(found_methods) > 3:
-            analysis["complexity"] = "medium"
-        
-        # Educational value (heuristic)
-        if any(marker in code for marker in ["#", "'''", '"""', "NOTE:", "TODO:"]):
-            if line_count > 30:
-                analysis["educational_value"] = "high"
-            else:
-                analysis["educational_value"] = "medium"
-        
-        return analysis
+        """Analyze a code snippet for Manim patterns
+
+        Results are memoized per snippet, since the same file often turns up
+        under several search queries; each call gets its own copy.
+        """
+        analysis = _analyze_code_snippet(code)
+        return {key: list(value) if isinstance(value, list) else value for key, value in analysis.items()}
     
     def extract_reusable_pattern(self, code: str, concept: str) -> Optional[Dict]:
         """Extract a reusable pattern from code"""
+        # Try to extract a complete class or function; bail out before any
+        # other scanning when there is none
+        class_block = _first_class_block(code)
+        if class_block is None or not _mentions_concept(code, concept):
+            return None
+        
         pattern = {
             "concept": concept,
-            "code_template": "",
+            "code_template": class_block,
             "required_imports": [],
             "example_usage": "",
             "notes": []
         }
         
-        # Extract imports
-        import_pattern = r'from manim import (.+)|import manim'
-        imports = re.findall(import_pattern, code)
-        if imports:
-            pattern["required_imports"] = [imp.strip() for imp in imports[0].split(',') if imp]
+        # Extract imports (only the first import line is used)
+        first_import = _IMPORT_RE.search(code)
+        if first_import:
+            imports = first_import.group(1) or ""
+            pattern["required_imports"] = [imp.strip() for imp in imports.split(',') if imp]
         
-        # Try to extract a complete class or function
-        class_pattern = rf'class\s+\w+.*?(?=\nclass|\n\n|\Z)'
-        classes = re.findall(class_pattern, code, re.DOTALL)
-        
-        if classes and concept in code.lower():
-            pattern["code_template"] = classes[0]
-            
-            # Extract any comments as notes
-            comment_pattern = r'#\s*(.+)'
-            comments = re.findall(comment_pattern, classes[0])
-            pattern["notes"] = comments[:3]  # First 3 comments
-            
-            return pattern
+        # Extract any comments as notes
+        pattern["notes"] = [
+            m.group(1) for m in islice(_COMMENT_RE.finditer(class_block), 3)  # First 3 comments
+        ]
         
-        return None
+        return pattern
     
     def generate_search_report(self) -> Dict:
         """Generate a comprehensive search report"""
+        # One pass over the results: collect repositories and tally the
+        # result types
+        repos = set()
+        file_results = repository_results = 0
+        for result in self.search_results:
+            repos.add(result.repo)
+            result_type = result.type
+            if result_type == "file":
+                file_results += 1
+            elif result_type == "repository":
+                repository_results += 1
+        
         report = {
             "search_date": datetime.now().isoformat(),
             "total_results": len(self.search_results),
-            "unique_repositories": len(set(r["url"].split("/")[:5] for r in self.search_results)),
-            "file_results": len([r for r in self.search_results if r["type"] == "file"]),
-            "repository_results": len([r for r in self.search_results if r["type"] == "repository"]),
+            "unique_repositories": len(repos),
+            "file_results": file_results,
+            "repository_results": repository_results,
             "discovered_patterns": len(self.pattern_library),
             "top_repositories": self._get_top_repositories(),
             "concept_distribution": self._get_concept_distribution()
@@ -212,30 +391,22 @@ class ManimGitHubSearcher:
     
     def _get_top_repositories(self, limit: int = 10) -> List[str]:
         """Get most frequently appearing repositories"""
-        repo_counts = {}
-        
-        for result in self.search_results:
-            repo = "/".join(result["url"].split("/")[:5])
-            repo_counts[repo] = repo_counts.get(repo, 0) + 1
-        
-        sorted_repos = sorted(repo_counts.items(), key=lambda x: x[1], reverse=True)
-        return [repo for repo, count in sorted_repos[:limit]]
+        repo_counts = Counter(r.repo for r in self.search_results)
+        return [repo for repo, count in repo_counts.most_common(limit)]
     
     def _get_concept_distribution(self) -> Dict[str, int]:
         """Get distribution of mathematical concepts found"""
-        concept_counts = {}
-        
-        for pattern in self.pattern_library.values():
-            for concept in pattern.get("mathematical_concepts", []):
-                concept_counts[concept] = concept_counts.get(concept, 0) + 1
-        
-        return concept_counts
+        return dict(Counter(
+            concept
+            for pattern in self.pattern_library.values()
+            for concept in pattern.get("mathematical_concepts", [])
+        ))
     
     def format_for_obsidian(self, search_focus: str) -> str:
         """Format search results for Obsidian note"""
         report = self.generate_search_report()
         
-        note = f"""# Manim GitHub Discovery - {search_focus.title()}
+        parts = [f"""# Manim GitHub Discovery - {search_focus.title()}
 
 ## Search Summary
 - **Date**: {report['search_date']}
@@ -244,24 +415,25 @@ class ManimGitHubSearcher:
 - **Discovered Patterns**: {report['discovered_patterns']}
 
 ## Top Repositories
-"""
+"""]
         
-        for i, repo in enumerate(report['top_repositories'], 1):
-            note += f"{i}. [{repo}]({repo})\n"
+        parts.extend(f"{i}. [{repo}]({repo})\n" for i, repo in enumerate(report['top_repositories'], 1))
         
-        note += "\n## Mathematical Concepts Found\n"
-        for concept, count in report['concept_distribution'].items():
-            note += f"- **{concept}**: {count} occurrences\n"
+        parts.append("\n## Mathematical Concepts Found\n")
+        parts.extend(
+            f"- **{concept}**: {count} occurrences\n"
+            for concept, count in report['concept_distribution'].items()
+        )
         
-        note += "\n## Valuable Discoveries\n"
+        parts.append("\n## Valuable Discoveries\n")
         
         # Add specific file discoveries
-        file_results = [r for r in self.search_results if r["type"] == "file"][:10]
+        file_results = islice((r for r in self.search_results if r.type == "file"), 10)
         for result in file_results:
-            note += f"\n### [{result['url'].split('/')[-1]}]({result['url']})\n"
-            note += f"{result['description'][:200]}...\n"
+            parts.append(f"\n### [{result.url.split('/')[-1]}]({result.url})\n")
+            parts.append(f"{result.description[:200]}...\n")
         
-        note += f"""
+        parts.append(f"""
 ## Integration Commands
 
 To fetch and analyze specific repositories:
@@ -283,9 +455,9 @@ ingest_to_obsidian(content=pattern_note, title="Manim Pattern - [Concept]", cate
 4. Test animations locally
 
 #manim #github #discovery #{search_focus}
-"""
+""")
         
-        return note
+        return "".join(parts)
 
 
 def create_mcp_search_commands(focus_areas: List[str]) -> List[str]:
@@ -294,8 +466,8 @@ def create_mcp_search_commands(focus_areas: List[str]) -> List[str]:
     commands = []
     
     for area in focus_areas:
-        queries = searcher.get_search_queries(area)
-        for query in queries[:3]:  # Limit to first 3 queries per area
+        queries = searcher.get_search_queries_iter(area)
+        for query in islice(queries, 3):  # Limit to first 3 queries per area
             commands.append(f'web_search("{query}")')
     
     return commands
@@ -324,6 +496,8 @@ result3 = web_search('site:github.com path:examples manim mathematical')
 Parse the search results to identify valuable repositories:
 
 ```python
+from manim_github_searcher import ManimGitHubSearcher, dumps_json
+
 # Initialize searcher
 searcher = ManimGitHubSearcher()
 
@@ -345,7 +519,7 @@ code = web_fetch("https://github.com/[user]/[repo]/blob/main/animations/gyrovect
 
 # Analyze the code
 analysis = searcher.analyze_code_snippet(code)
-print(json.dumps(analysis, indent=2))
+print(dumps_json(analysis))
 ```
 
 ## Step 4: Extract Patterns
@@ -377,7 +551,7 @@ ingest_to_obsidian(
 
 # Generate search report
 report = searcher.generate_search_report()
-print(json.dumps(report, indent=2))
+print(dumps_json(report))
 ```
 
 ## Step 6: Create Enhanced Templates
@@ -398,7 +572,7 @@ for pattern_name, pattern in searcher.pattern_library.items():
         
         # Save template
         save_to_dropbox(
-            content=json.dumps(template, indent=2),
+            content=dumps_json(template),
             file_path=f"MCP_Tools/manim_templates/{pattern_name}.json"
         )
 ```
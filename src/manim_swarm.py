@@ -5,14 +5,75 @@ Discovers and catalogs Manim animation patterns from GitHub repositories
 """
 
 import json
+import logging
+import os
 import re
 import asyncio
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Final, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import lru_cache
 import hashlib
+from collections import Counter
+from itertools import groupby
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    from .github_api import open_session, search_repositories
+except ImportError:
+    from github_api import open_session, search_repositories
+
+logger = logging.getLogger(__name__)
+
+_RULE = "=" * 60
+
+# Repository keyword -> concept, in priority order
+_CONCEPT_KEYWORDS = {
+    "gyrovector": "Gyrovector Operations",
+    "stereographic": "Stereographic Projection",
+    "mobius": "Möbius Transformation",
+    "manifold": "Manifold Visualization",
+    "topology": "Topological Structures",
+    "hyperbolic": "Hyperbolic Geometry",
+    "clifford": "Clifford Algebra",
+    "lie": "Lie Groups and Algebras",
+    "derivative": "Calculus Visualization",
+    "integral": "Integration Techniques"
+}
+# Description features, matched case-insensitively as plain substrings so
+# descriptions need no lowercased copy
+_DESC_3D_RE = re.compile("3d|three", re.IGNORECASE)
+_DESC_INTERACTIVE_RE = re.compile("interactive", re.IGNORECASE)
+_DESC_EDUCATIONAL_RE = re.compile("educational", re.IGNORECASE)
+_DESC_EXAMPLE_RE = re.compile("example|tutorial", re.IGNORECASE)
+_DESC_VISUALIZATION_RE = re.compile("visualization", re.IGNORECASE)
+
+# Shared by every extracted pattern
+_DEFAULT_DEPS: Final[Tuple[str, ...]] = ("manim>=0.17.0", "numpy")
+
+# Caps concurrent scout searches and repository fetches
+MAX_CONCURRENT_REQUESTS = 64
+
+# Worker pool sizes for the scout -> analyzer -> extractor pipeline
+SCOUT_WORKERS = 8
+ANALYZER_WORKERS = 16
+EXTRACTOR_WORKERS = 8
+
+_CONCEPT_PRIORITY = {keyword: i for i, keyword in enumerate(_CONCEPT_KEYWORDS)}
+_CONCEPT_RE = re.compile("|".join(re.escape(k) for k in _CONCEPT_KEYWORDS), re.IGNORECASE)
+
+@dataclass(slots=True, frozen=True)
 class ManimPattern:
     """Represents a discovered Manim animation pattern"""
     pattern_id: str
@@ -20,43 +81,165 @@ class ManimPattern:
     mathematical_concept: str
     code_snippet: str
     description: str
-    tags: List[str]
+    tags: Tuple[str, ...]
     quality_score: float
     reusability: str
-    dependencies: List[str]
+    dependencies: Tuple[str, ...]
     discovered_at: str
     
     def to_obsidian_note(self) -> str:
         """Convert pattern to Obsidian note format"""
-        return f"""# Manim Pattern: {self.mathematical_concept}
+        return _render_obsidian_note(self)
+
+
+@lru_cache(maxsize=1024)
+def _render_obsidian_note(pattern: ManimPattern) -> str:
+    """Render a pattern's Obsidian note once; frozen patterns hash by value"""
+    hashtags = "#" + " #".join(pattern.tags) if pattern.tags else ""
+    return f"""# Manim Pattern: {pattern.mathematical_concept}
 
 ## Overview
-- **Pattern ID**: {self.pattern_id}
-- **Source**: {self.source_url}
-- **Quality Score**: {self.quality_score}/1.0
-- **Reusability**: {self.reusability}
-- **Discovered**: {self.discovered_at}
+- **Pattern ID**: {pattern.pattern_id}
+- **Source**: {pattern.source_url}
+- **Quality Score**: {pattern.quality_score}/1.0
+- **Reusability**: {pattern.reusability}
+- **Discovered**: {pattern.discovered_at}
 
 ## Description
-{self.description}
+{pattern.description}
 
 ## Code
 ```python
-{self.code_snippet}
+{pattern.code_snippet}
 ```
 
 ## Dependencies
-{', '.join(self.dependencies)}
+{', '.join(pattern.dependencies)}
 
 ## Tags
-{' '.join([f'#{tag}' for tag in self.tags])}
+{hashtags}
 
 ## Related Patterns
 - [[Manim Pattern Catalog]]
-- [[{self.mathematical_concept} Visualizations]]
+- [[{pattern.mathematical_concept} Visualizations]]
 """
 
 
+def _dumps_report(obj) -> str:
+    """Pretty-print obj as JSON, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+async def _gather_or_cancel(*aws):
+    """asyncio.gather() that cancels the remaining awaitables when one fails"""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _pattern_category(pattern: ManimPattern) -> str:
+    """Catalog category of a pattern: the first word of its concept"""
+    return pattern.mathematical_concept.partition(" ")[0]
+
+
+# Example code per concept, built once at import
+_CODE_EXAMPLES: Final[Dict[str, str]] = {
+    "Gyrovector Operations": """
+class GyroveorAnimation(Scene):
+    def construct(self):
+        # Poincaré disk setup
+        disk = Circle(radius=2, color=WHITE)
+        self.add(disk)
+        
+        # Gyrovectors
+        u = np.array([0.3, 0.4, 0])
+        v = np.array([0.1, 0.2, 0])
+        
+        # Visualize gyroaddition
+        u_arrow = Arrow(ORIGIN, u*2, color=BLUE)
+        v_arrow = Arrow(ORIGIN, v*2, color=GREEN)
+        result = self.gyro_add(u, v)
+        result_arrow = Arrow(ORIGIN, result*2, color=RED)
+        
+        self.play(Create(u_arrow), Create(v_arrow))
+        self.play(Transform(VGroup(u_arrow, v_arrow), result_arrow))
+    
+    def gyro_add(self, u, v):
+        # Einstein velocity addition
+        gamma_u = 1 / np.sqrt(1 - np.dot(u, u))
+        return (u + v/gamma_u) / (1 + np.dot(u, v))
+""",
+    "Stereographic Projection": """
+class StereographicProjection(ThreeDScene):
+    def construct(self):
+        self.set_camera_orientation(phi=75*DEGREES, theta=-45*DEGREES)
+        
+        # Create S³ representation (as S²)
+        sphere = Sphere(radius=2, resolution=(30, 30))
+        sphere.set_color(BLUE_E)
+        
+        # Projection plane
+        plane = Square(side_length=6).rotate(PI/2, RIGHT)
+        plane.shift(3*DOWN)
+        
+        # Animate projection
+        self.play(Create(sphere), Create(plane))
+        
+        # Project points
+        def project(p):
+            x, y, z = p
+            return np.array([x/(1-z), y/(1-z), -3])
+        
+        # Show projection lines
+        sample_points = sphere.get_all_points()[::100]
+        for p in sample_points:
+            proj_line = Line3D(p, project(p), color=YELLOW)
+            self.play(Create(proj_line), run_time=0.1)
+"""
+}
+
+# Search queries per category, built once at import
+_SEARCH_QUERIES: Final[Dict[str, Tuple[str, ...]]] = {
+    "gyrovector": (
+        "site:github.com manim gyrovector",
+        "site:github.com manim gyroaddition visualization",
+        "site:github.com manim poincare disk animation",
+        "site:github.com manim hyperbolic geometry"
+    ),
+    "topology": (
+        "site:github.com manim manifold visualization",
+        "site:github.com manim topology animation",
+        "site:github.com manim fiber bundle",
+        "site:github.com manim homology"
+    ),
+    "geometry": (
+        "site:github.com manim stereographic projection",
+        "site:github.com manim mobius transformation",
+        "site:github.com manim conformal mapping",
+        "site:github.com manim differential geometry"
+    ),
+    "algebra": (
+        "site:github.com manim group theory visualization",
+        "site:github.com manim lie algebra",
+        "site:github.com manim clifford algebra",
+        "site:github.com manim representation theory"
+    ),
+    "calculus": (
+        "site:github.com manim derivative visualization",
+        "site:github.com manim integral animation",
+        "site:github.com manim vector field",
+        "site:github.com manim differential equation"
+    )
+}
+
+
 class ManimSwarm:
     """The Manim Swarm system for discovering animation patterns across GitHub"""
     
@@ -64,6 +247,9 @@ class ManimSwarm:
         self.name = name
         self.discovered_patterns = []
         self.search_queries = self._initialize_search_queries()
+        # Per-category and flattened query tuples, built once per swarm
+        self._queries_by_cat = {k: tuple(v) for k, v in self.search_queries.items()}
+        self._queries_all = tuple(q for qs in self._queries_by_cat.values() for q in qs)
         self.quality_thresholds = {
             "min_stars": 5,
             "min_documentation_ratio": 0.1,
@@ -75,90 +261,129 @@ class ManimSwarm:
             "extractor": True,
             "cataloger": True
         }
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._session: Optional["aiohttp.ClientSession"] = None
     
-    def _initialize_search_queries(self) -> Dict[str, List[str]]:
+    def _initialize_search_queries(self) -> Dict[str, Tuple[str, ...]]:
         """Initialize search queries for different mathematical concepts"""
-        return {
-            "gyrovector": [
-                "site:github.com manim gyrovector",
-                "site:github.com manim gyroaddition visualization",
-                "site:github.com manim poincare disk animation",
-                "site:github.com manim hyperbolic geometry"
-            ],
-            "topology": [
-                "site:github.com manim manifold visualization",
-                "site:github.com manim topology animation",
-                "site:github.com manim fiber bundle",
-                "site:github.com manim homology"
-            ],
-            "geometry": [
-                "site:github.com manim stereographic projection",
-                "site:github.com manim mobius transformation",
-                "site:github.com manim conformal mapping",
-                "site:github.com manim differential geometry"
-            ],
-            "algebra": [
-                "site:github.com manim group theory visualization",
-                "site:github.com manim lie algebra",
-                "site:github.com manim clifford algebra",
-                "site:github.com manim representation theory"
-            ],
-            "calculus": [
-                "site:github.com manim derivative visualization",
-                "site:github.com manim integral animation",
-                "site:github.com manim vector field",
-                "site:github.com manim differential equation"
-            ]
-        }
+        return dict(_SEARCH_QUERIES)
     
     async def deploy_swarm(self, category: str = "all", max_patterns: int = 50) -> List[ManimPattern]:
-        """Deploy the Manim Swarm to discover patterns"""
-        patterns = []
-        
-        print(f"\n{'='*60}")
-        print(f"{self.name} Deployment Started")
-        print(f"Target: {category} | Max Patterns: {max_patterns}")
-        print('='*60)
+        """Deploy the Manim Swarm to discover patterns
+
+        With aiohttp installed and GITHUB_TOKEN set, scouts search GitHub
+        over one shared session for the whole deployment; otherwise they
+        return mock results.
+        """
+        if AIOHTTP_AVAILABLE and os.getenv("GITHUB_TOKEN") and self._session is None:
+            self._session = open_session(limit=MAX_CONCURRENT_REQUESTS)
+        try:
+            return await self._deploy(category, max_patterns)
+        finally:
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+    
+    async def _deploy(self, category: str, max_patterns: int) -> List[ManimPattern]:
+        """Run the scout, analyzer, extractor and cataloger phases"""
+        logger.info("\n%s\n%s Deployment Started\nTarget: %s | Max Patterns: %d\n%s",
+                    _RULE, self.name, category, max_patterns, _RULE)
         
         # Select queries based on category
-        if category == "all":
-            queries = [q for queries in self.search_queries.values() for q in queries]
-        else:
-            queries = self.search_queries.get(category, [])
+        queries = self._queries_all if category == "all" else self._queries_by_cat.get(category, ())
+        
+        # One timestamp for the whole deployment; its patterns share it
+        now_iso = datetime.now().isoformat()
         
-        # Scout Phase
+        # Scout, Analyzer and Extractor Phases
         if self.active_agents["scout"]:
-            print("\n[Scout Agent] Searching GitHub...")
-            for query in queries[:10]:  # Limit queries
-                print(f"  → {query}")
-                results = await self._scout_search(query)
-                
-                # Analyzer Phase
-                if self.active_agents["analyzer"]:
-                    for result in results:
-                        if await self._analyze_repository(result):
-                            # Extractor Phase
-                            if self.active_agents["extractor"]:
-                                pattern = await self._extract_pattern(result)
-                                if pattern and len(patterns) < max_patterns:
-                                    patterns.append(pattern)
-                                    print(f"  ✓ Extracted: {pattern.mathematical_concept}")
+            logger.info("\n[Scout Agent] Searching GitHub...")
+            queries = queries[:10]  # Limit queries
+            if logger.isEnabledFor(logging.INFO):
+                for query in queries:
+                    logger.info("  → %s", query)
+            
+            # Patterns finish in any order; restore query order before capping
+            extracted = await self._run_pipeline(queries, now_iso)
+            patterns = [pattern for _, pattern in sorted(extracted, key=lambda item: item[0])[:max_patterns]]
+            if logger.isEnabledFor(logging.INFO):
+                for pattern in patterns:
+                    logger.info("  ✓ Extracted: %s", pattern.mathematical_concept)
+        else:
+            patterns = []
         
         # Cataloger Phase
         if self.active_agents["cataloger"] and patterns:
-            print(f"\n[Cataloger Agent] Organizing {len(patterns)} patterns...")
+            logger.info("\n[Cataloger Agent] Organizing %d patterns...", len(patterns))
             self.discovered_patterns.extend(patterns)
             await self._catalog_patterns(patterns)
         
-        print(f"\n{'='*60}")
-        print(f"Swarm Complete: {len(patterns)} patterns discovered")
-        print('='*60)
+        logger.info("\n%s\nSwarm Complete: %d patterns discovered\n%s", _RULE, len(patterns), _RULE)
         
         return patterns
     
+    async def _run_pipeline(self, queries: Tuple[str, ...],
+                            discovered_at: str) -> List[Tuple[Tuple[int, int], ManimPattern]]:
+        """Stream queries through scout, analyzer and extractor worker pools
+
+        Each stage hands its output to the next over an asyncio.Queue as soon
+        as it is ready, so a repository is analyzed while other searches are
+        still running. Patterns come back tagged with their (query, result)
+        position. Stages whose agent is inactive are not fed. If any worker
+        raises, every stage is cancelled and the error propagates.
+        """
+        to_scout: asyncio.Queue = asyncio.Queue()
+        to_analyze: asyncio.Queue = asyncio.Queue()
+        to_extract: asyncio.Queue = asyncio.Queue()
+        extracted: List[Tuple[Tuple[int, int], ManimPattern]] = []
+        
+        for item in enumerate(queries):
+            to_scout.put_nowait(item)
+        
+        async def scout(i: int, query: str) -> None:
+            async with self._request_semaphore:
+                results = await self._scout_search(query)
+            if self.active_agents["analyzer"]:
+                for j, result in enumerate(results):
+                    to_analyze.put_nowait(((i, j), result))
+        
+        async def analyze(position: Tuple[int, int], result: Dict) -> None:
+            async with self._request_semaphore:
+                accepted = await self._analyze_repository(result)
+            if accepted and self.active_agents["extractor"]:
+                to_extract.put_nowait((position, result))
+        
+        async def extract(position: Tuple[int, int], result: Dict) -> None:
+            pattern = await self._extract_pattern(result, discovered_at=discovered_at)
+            if pattern:
+                extracted.append((position, pattern))
+        
+        async def stage(inbox: asyncio.Queue, handle, workers: int,
+                        outbox: Optional[asyncio.Queue] = None, outbox_workers: int = 0) -> None:
+            # inbox ends with one None per worker; once every worker is done,
+            # pass the same signal on to the next stage
+            async def worker() -> None:
+                while (item := await inbox.get()) is not None:
+                    await handle(*item)
+            
+            await _gather_or_cancel(*(worker() for _ in range(workers)))
+            for _ in range(outbox_workers):
+                outbox.put_nowait(None)
+        
+        for _ in range(SCOUT_WORKERS):
+            to_scout.put_nowait(None)
+        await _gather_or_cancel(
+            stage(to_scout, scout, SCOUT_WORKERS, to_analyze, ANALYZER_WORKERS),
+            stage(to_analyze, analyze, ANALYZER_WORKERS, to_extract, EXTRACTOR_WORKERS),
+            stage(to_extract, extract, EXTRACTOR_WORKERS)
+        )
+        return extracted
+    
     async def _scout_search(self, query: str) -> List[Dict]:
         """Scout agent: Search GitHub for repositories"""
-        # In real implementation, this would use web_search
+        if self._session is not None:
+            return await search_repositories(self._session, query)
+        
         # For demonstration, returning mock results
         mock_results = []
         
@@ -183,28 +408,33 @@ class ManimSwarm:
         """Analyzer agent: Evaluate repository quality"""
         # Check quality indicators
         stars = repo.get("stars", 0)
-        has_description = bool(repo.get("description"))
+        desc = repo.get("description") or ""
         
         # Simple quality check
         quality_score = 0
         if stars >= self.quality_thresholds["min_stars"]:
             quality_score += 0.5
-        if has_description:
+        if desc:
             quality_score += 0.3
-        if "visualization" in repo.get("description", "").lower():
+        if _DESC_VISUALIZATION_RE.search(desc):
             quality_score += 0.2
         
         return quality_score >= self.quality_thresholds["min_code_quality"]
     
-    async def _extract_pattern(self, result: Dict) -> Optional[ManimPattern]:
-        """Extractor agent: Extract reusable pattern from repository"""
+    async def _extract_pattern(self, result: Dict, discovered_at: Optional[str] = None) -> Optional[ManimPattern]:
+        """Extractor agent: Extract reusable pattern from repository
+
+        discovered_at lets a deployment share one timestamp instead of
+        reading the clock per pattern.
+        """
         # Extract mathematical concept
         concept = self._identify_concept(result)
         if not concept:
             return None
         
         # Generate pattern ID
-        pattern_id = f"manim_{concept.lower().replace(' ', '_')}_{hashlib.md5(result['url'].encode()).hexdigest()[:8]}"
+        url_hash = hashlib.blake2b(result['url'].encode(), digest_size=4).hexdigest()
+        pattern_id = f"manim_{concept.lower().replace(' ', '_')}_{url_hash}"
         
         # Create example code based on concept
         code_snippet = self._generate_example_code(concept)
@@ -218,92 +448,28 @@ class ManimSwarm:
             tags=self._extract_tags(concept, result),
             quality_score=self._calculate_quality_score(result),
             reusability=self._assess_reusability(code_snippet),
-            dependencies=["manim>=0.17.0", "numpy"],
-            discovered_at=datetime.now().isoformat()
+            dependencies=_DEFAULT_DEPS,
+            discovered_at=discovered_at or datetime.now().isoformat()
         )
     
     def _identify_concept(self, result: Dict) -> Optional[str]:
         """Identify mathematical concept from repository"""
-        title = result.get("title", "").lower()
-        desc = result.get("description", "").lower()
-        
-        concepts = {
-            "gyrovector": "Gyrovector Operations",
-            "stereographic": "Stereographic Projection",
-            "mobius": "Möbius Transformation",
-            "manifold": "Manifold Visualization",
-            "topology": "Topological Structures",
-            "hyperbolic": "Hyperbolic Geometry",
-            "clifford": "Clifford Algebra",
-            "lie": "Lie Groups and Algebras",
-            "derivative": "Calculus Visualization",
-            "integral": "Integration Techniques"
-        }
+        text = f'{result.get("title") or ""}\n{result.get("description") or ""}'
         
-        for keyword, concept in concepts.items():
-            if keyword in title or keyword in desc:
-                return concept
-        return None
+        # One case-insensitive scan for all keywords; the highest-priority
+        # keyword wins
+        matches = _CONCEPT_RE.findall(text)
+        if not matches:
+            return None
+        return _CONCEPT_KEYWORDS[min((m.lower() for m in matches), key=_CONCEPT_PRIORITY.__getitem__)]
     
-    def _generate_example_code(self, concept: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _generate_example_code(concept: str) -> str:
         """Generate example code for concept"""
-        examples = {
-            "Gyrovector Operations": """
-class GyroveorAnimation(Scene):
-    def construct(self):
-        # Poincaré disk setup
-        disk = Circle(radius=2, color=WHITE)
-        self.add(disk)
-        
-        # Gyrovectors
-        u = np.array([0.3, 0.4, 0])
-        v = np.array([0.1, 0.2, 0])
-        
-        # Visualize gyroaddition
-        u_arrow = Arrow(ORIGIN, u*2, color=BLUE)
-        v_arrow = Arrow(ORIGIN, v*2, color=GREEN)
-        result = self.gyro_add(u, v)
-        result_arrow = Arrow(ORIGIN, result*2, color=RED)
-        
-        self.play(Create(u_arrow), Create(v_arrow))
-        self.play(Transform(VGroup(u_arrow, v_arrow), result_arrow))
+        return _CODE_EXAMPLES.get(concept, "# Example code for " + concept)
     
-    def gyro_add(self, u, v):
-        # Einstein velocity addition
-        gamma_u = 1 / np.sqrt(1 - np.dot(u, u))
-        return (u + v/gamma_u) / (1 + np.dot(u, v))
-""",
-            "Stereographic Projection": """
-class StereographicProjection(ThreeDScene):
-    def construct(self):
-        self.set_camera_orientation(phi=75*DEGREES, theta=-45*DEGREES)
-        
-        # Create S³ representation (as S²)
-        sphere = Sphere(radius=2, resolution=(30, 30))
-        sphere.set_color(BLUE_E)
-        
-        # Projection plane
-        plane = Square(side_length=6).rotate(PI/2, RIGHT)
-        plane.shift(3*DOWN)
-        
-        # Animate projection
-        self.play(Create(sphere), Create(plane))
-        
-        # Project points
-        def project(p):
-            x, y, z = p
-            return np.array([x/(1-z), y/(1-z), -3])
-        
-        # Show projection lines
-        sample_points = sphere.get_all_points()[::100]
-        for p in sample_points:
-            proj_line = Line3D(p, project(p), color=YELLOW)
-            self.play(Create(proj_line), run_time=0.1)
-"""
-        }
-        return examples.get(concept, "# Example code for " + concept)
-    
-    def _extract_tags(self, concept: str, result: Dict) -> List[str]:
+    def _extract_tags(self, concept: str, result: Dict) -> Tuple[str, ...]:
         """Extract relevant tags"""
         tags = ["manim", "animation", "mathematics"]
         
@@ -312,15 +478,15 @@ class StereographicProjection(ThreeDScene):
         tags.extend(concept_words)
         
         # Add technique tags from description
-        desc = result.get("description", "").lower()
-        if "3d" in desc or "three" in desc:
+        desc = result.get("description") or ""
+        if _DESC_3D_RE.search(desc):
             tags.append("3d")
-        if "interactive" in desc:
+        if _DESC_INTERACTIVE_RE.search(desc):
             tags.append("interactive")
-        if "educational" in desc:
+        if _DESC_EDUCATIONAL_RE.search(desc):
             tags.append("educational")
         
-        return list(set(tags))
+        return tuple(dict.fromkeys(tags))
     
     def _calculate_quality_score(self, result: Dict) -> float:
         """Calculate quality score for pattern"""
@@ -336,37 +502,34 @@ class StereographicProjection(ThreeDScene):
             score += 0.1
         
         # Description quality
-        desc = result.get("description", "")
+        desc = result.get("description") or ""
         if len(desc) > 50:
             score += 0.1
-        if "example" in desc.lower() or "tutorial" in desc.lower():
+        if _DESC_EXAMPLE_RE.search(desc):
             score += 0.1
         
         return min(score, 1.0)
     
     def _assess_reusability(self, code: str) -> str:
         """Assess pattern reusability"""
-        if "class" in code and "def" in code:
-            if code.count("def") > 2:
-                return "high"
-            return "medium"
-        return "low"
+        # One count covers both the presence and the number of defs
+        if "class" not in code:
+            return "low"
+        defs = code.count("def")
+        if not defs:
+            return "low"
+        return "high" if defs > 2 else "medium"
     
     async def _catalog_patterns(self, patterns: List[ManimPattern]) -> None:
         """Cataloger agent: Organize patterns into knowledge base"""
-        catalog = {}
-        
-        # Categorize patterns
-        for pattern in patterns:
-            category = pattern.mathematical_concept.split()[0]
-            if category not in catalog:
-                catalog[category] = []
-            catalog[category].append(pattern)
-        
-        # Generate catalog report
-        print("\n[Catalog Summary]")
-        for category, cat_patterns in catalog.items():
-            print(f"  {category}: {len(cat_patterns)} patterns")
+        # The summary is the only output, so skip the sort when it is not logged
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        # Categorize patterns with one sort, so categories print in order
+        logger.info("\n[Catalog Summary]")
+        for category, cat_patterns in groupby(sorted(patterns, key=_pattern_category), _pattern_category):
+            logger.info("  %s: %d patterns", category, sum(1 for _ in cat_patterns))
     
     def generate_swarm_report(self) -> Dict:
         """Generate comprehensive swarm activity report"""
@@ -382,33 +545,23 @@ class StereographicProjection(ThreeDScene):
     
     def _get_category_distribution(self) -> Dict[str, int]:
         """Get distribution of patterns by category"""
-        distribution = {}
-        for pattern in self.discovered_patterns:
-            category = pattern.mathematical_concept.split()[0]
-            distribution[category] = distribution.get(category, 0) + 1
-        return distribution
+        return dict(Counter(map(_pattern_category, self.discovered_patterns)))
     
     def _get_quality_distribution(self) -> Dict[str, int]:
         """Get distribution of patterns by quality"""
-        distribution = {"high": 0, "medium": 0, "low": 0}
-        for pattern in self.discovered_patterns:
-            if pattern.quality_score >= 0.8:
-                distribution["high"] += 1
-            elif pattern.quality_score >= 0.6:
-                distribution["medium"] += 1
-            else:
-                distribution["low"] += 1
-        return distribution
+        import numpy as np  # deferred: only reports need it
+        
+        # float64, not float32: rounding could push a score just under a
+        # threshold over it
+        scores = np.fromiter((p.quality_score for p in self.discovered_patterns),
+                             dtype=np.float64, count=len(self.discovered_patterns))
+        low, medium, high = np.bincount(np.digitize(scores, [0.6, 0.8]), minlength=3)
+        return {"high": int(high), "medium": int(medium), "low": int(low)}
     
     def _get_top_concepts(self, limit: int = 5) -> List[str]:
         """Get most common mathematical concepts"""
-        concept_counts = {}
-        for pattern in self.discovered_patterns:
-            concept = pattern.mathematical_concept
-            concept_counts[concept] = concept_counts.get(concept, 0) + 1
-        
-        sorted_concepts = sorted(concept_counts.items(), key=lambda x: x[1], reverse=True)
-        return [concept for concept, count in sorted_concepts[:limit]]
+        concept_counts = Counter(pattern.mathematical_concept for pattern in self.discovered_patterns)
+        return [concept for concept, count in concept_counts.most_common(limit)]
     
     def enhance_agents(self, patterns: List[ManimPattern]) -> Dict[str, int]:
         """Enhance math-animator and clifford-geom-expert with discovered patterns"""
@@ -452,7 +605,7 @@ async def run_manim_swarm(concept: str = "all", deploy_full: bool = False):
         print("\n" + "="*60)
         print("MANIM SWARM FINAL REPORT")
         print("="*60)
-        print(json.dumps(report, indent=2))
+        print(_dumps_report(report))
         
         return all_patterns
     else:
@@ -471,26 +624,24 @@ def create_mcp_commands(patterns: List[ManimPattern]) -> List[str]:
     commands = []
     
     for pattern in patterns[:5]:  # Top 5 patterns
-        # Fetch actual code
-        commands.append(f'web_fetch("{pattern.source_url}")')
-        
-        # Analyze with Gemini
-        commands.append(
+        commands.extend((
+            # Fetch actual code
+            f'web_fetch("{pattern.source_url}")',
+            # Analyze with Gemini
             f'gemini_analyze_code(code=pattern_{pattern.pattern_id}, '
-            f'analysis_type="quality")'
-        )
-        
-        # Save to Obsidian
-        commands.append(
+            f'analysis_type="quality")',
+            # Save to Obsidian
             f'ingest_to_obsidian(content="""{pattern.to_obsidian_note()}""", '
             f'title="Manim Pattern - {pattern.mathematical_concept}", '
-            f'category="concepts", tags={pattern.tags})'
-        )
+            f'category="concepts", tags={list(pattern.tags)})'
+        ))
     
     return commands
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Example usage
     print("MANIM SWARM - Pattern Discovery System")
     print("=====================================\n")
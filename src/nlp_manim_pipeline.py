@@ -4,14 +4,79 @@ Enhanced module for translating plain English to mathematically accurate animati
 """
 
 import re
+import copy
 import json
+import threading
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import spacy
 from sympy import symbols, simplify, latex
 import numpy as np
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Per-call patterns, compiled once at import
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:second|sec)s?")
+_ANGLE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:degree|rad|°)")
+_REF_RE = re.compile(r"(?:relative to|around)\s+(?:the\s+)?(\w+)")
+
+# Numerical stability rules: risky construct -> (guard that makes it safe,
+# message when the guard is missing)
+_STABILITY_RULES = {
+    "div_z": ("z_bound", "Division by (1-z) without bounds check"),
+    "norm": ("norm_check", "Vector normalization without zero check")
+}
+_STABILITY_RE = re.compile(
+    r"(?P<div_z>/ \(1 -)|(?P<z_bound>0\.99)|(?P<norm_check>if norm)|(?P<norm>norm\()"
+)
+
+# Transformation keywords, in reporting order
+_TRANSFORM_KEYWORDS = {
+    "rotation": ("rotate", "spin", "turn"),
+    "projection": ("project", "map"),
+    "translation": ("move", "shift", "translate"),
+    "scaling": ("scale", "resize", "zoom")
+}
+
+# Parameter value -> keywords, first match wins
+_QUALITY_KEYWORDS = {
+    "4k": ("4k", "high quality", "ultra"),
+    "preview": ("preview", "quick")
+}
+_STYLE_KEYWORDS = {
+    "artistic": ("artistic", "beautiful"),
+    "minimalist": ("minimal", "simple")
+}
+
+_KEYWORDS = frozenset(
+    keyword
+    for table in (_TRANSFORM_KEYWORDS, _QUALITY_KEYWORDS, _STYLE_KEYWORDS)
+    for keywords in table.values()
+    for keyword in keywords
+)
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton over the transformation and parameter keywords"""
+    automaton = ahocorasick.Automaton()
+    for keyword in _KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+
+def _keywords_in(text: str) -> frozenset:
+    """Keywords occurring anywhere in text, found in one pass"""
+    if _KEYWORD_AUTOMATON is not None:
+        return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text))
+    return frozenset(keyword for keyword in _KEYWORDS if keyword in text)
+
 class AnimationType(Enum):
     """Types of animations supported"""
     GEOMETRIC_TRANSFORM = "geometric_transform"
@@ -20,6 +85,14 @@ class AnimationType(Enum):
     FIELD_DYNAMICS = "field_dynamics"
     ALGEBRAIC_STRUCTURE = "algebraic_structure"
 
+# Concepts that decide the animation type, in detection priority order
+_CONCEPT_TYPES = {
+    "stereographic_projection": AnimationType.GEOMETRIC_TRANSFORM,
+    "gyrovector_operation": AnimationType.VECTOR_OPERATION,
+    "mobius_transformation": AnimationType.GEOMETRIC_TRANSFORM,
+    "hyperbolic_space": AnimationType.MANIFOLD_VISUALIZATION
+}
+
 @dataclass
 class AnimationRequest:
     """Structured representation of animation request"""
@@ -29,22 +102,57 @@ class AnimationRequest:
     transformations: List[Dict[str, Any]]
     parameters: Dict[str, Any]
     validation_required: bool = True
+    # Column view of objects, built once by the parser
+    object_table: Optional["ObjectTable"] = field(default=None, repr=False, compare=False)
+
+@dataclass
+class ObjectTable:
+    """Objects as columns, one row per object, so checks run as array ops"""
+    types: np.ndarray       # (N,) object type names
+    values: Tuple[str, ...]
+    positions: np.ndarray   # (N, 2) int32 match spans
+    coords: np.ndarray      # (N, max_dim) float64, zero-padded
+    dims: np.ndarray        # (N,) number of coordinates, 0 when absent
+    
+    @classmethod
+    def from_objects(cls, objects: List[Dict[str, Any]]) -> "ObjectTable":
+        """Build the table from extracted object dicts"""
+        n = len(objects)
+        dims = np.fromiter((len(o.get("coordinates", ())) for o in objects), dtype=np.int32, count=n)
+        coords = np.zeros((n, int(dims.max(initial=0))))
+        for i, obj in enumerate(objects):
+            if dims[i]:
+                coords[i, :dims[i]] = obj["coordinates"]
+        return cls(
+            types=np.array([o["type"] for o in objects], dtype=str),
+            values=tuple(o["value"] for o in objects),
+            positions=np.array([o["position"] for o in objects], dtype=np.int32).reshape(n, 2),
+            coords=coords,
+            dims=dims
+        )
+    
+    @property
+    def has_coords(self) -> np.ndarray:
+        """Mask of the objects that carry coordinates"""
+        return self.dims > 0
 
 class NLPAnimationParser:
     """Parse natural language descriptions into structured animation requests"""
     
+    # spaCy model shared by every parser, loaded on first use
+    _nlp = None
+    _nlp_lock = threading.Lock()
+    
     def __init__(self):
-        # Load spaCy model for NLP
-        self.nlp = spacy.load("en_core_web_sm")
-        
-        # Mathematical concept patterns
-        self.concept_patterns = {
+        # Mathematical concept patterns, compiled once per parser. Patterns
+        # are written in lowercase and matched case-sensitively against the
+        # normalized (lowercased) description
+        concept_patterns = {
             "stereographic_projection": [
                 r"stereo(?:graphic)?\s+project(?:ed|ion)?",
                 r"project\s+.*\s+(?:on|onto)\s+.*\s+plane"
             ],
             "gyrovector_operation": [
-                r"gyro(?:addition|scalar|distance|parallel)",
                 r"(?:add|multiply|transport)\s+.*\s+gyrovector"
             ],
             "rotation": [
@@ -60,68 +168,122 @@ class NLPAnimationParser:
                 r"hyperbolic\s+(?:plane|space|geometry)"
             ]
         }
+        self.concept_patterns = {
+            concept: [re.compile(p) for p in patterns]
+            for concept, patterns in concept_patterns.items()
+        }
+        
+        # Single-word concept keywords, matched as token prefixes so that
+        # inflected forms (gyrodistances, ...) count too
+        self.concept_keywords = {
+            "gyroaddition": "gyrovector_operation",
+            "gyroscalar": "gyrovector_operation",
+            "gyrodistance": "gyrovector_operation",
+            "gyroparallel": "gyrovector_operation"
+        }
+        self._keyword_prefixes = tuple(self.concept_keywords)
         
         # Object extraction patterns
-        self.object_patterns = {
-            "sphere": r"S[²³⁴]?\s*sphere|(?:unit\s+)?sphere",
+        object_patterns = {
+            "sphere": r"s[²³⁴]?\s*sphere|(?:unit\s+)?sphere",
             "plane": r"(?:polar|complex|euclidean)?\s*plane",
             "vector": r"\[[\d.,\s-]+\]|vector\s*\([\d.,\s-]+\)",
             "point": r"point\s*(?:at\s*)?\([\d.,\s-]+\)",
             "manifold": r"(?:manifold|surface|space)"
         }
+        self.object_patterns = {
+            obj_type: re.compile(p) for obj_type, p in object_patterns.items()
+        }
+
+    @classmethod
+    def _get_nlp(cls):
+        """Load the spaCy model once per process"""
+        if cls._nlp is None:
+            with cls._nlp_lock:
+                if cls._nlp is None:
+                    # The parser only reads tokens, so the statistical
+                    # components are disabled
+                    cls._nlp = spacy.load(
+                        "en_core_web_sm",
+                        disable=["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+                    )
+        return cls._nlp
+    
+    @property
+    def nlp(self):
+        """Shared spaCy model"""
+        return self._get_nlp()
+    
+    def parse(self, description: str, doc=None) -> AnimationRequest:
+        """Parse natural language description into structured request
 
-    def parse(self, description: str) -> AnimationRequest:
-        """Parse natural language description into structured request"""
+        The description is lowercased first, and every extraction step
+        relies on that: their patterns are lowercase and case-sensitive. doc
+        may be passed in by batch callers that already ran the normalized
+        description through nlp.pipe.
+        """
         # Normalize text
-        description = description.lower().strip()
+        description = self.normalize(description)
+        
+        # Parse with spaCy
+        if doc is None:
+            doc = self.nlp(description)
         
         # Detect animation type
-        animation_type = self._detect_animation_type(description)
+        animation_type = self._detect_animation_type(description, doc)
         
         # Extract objects
-        objects = self._extract_objects(description)
+        objects = self._extract_objects(description, doc)
+        
+        # Find every transformation and parameter keyword in one scan
+        keywords = _keywords_in(description)
         
         # Extract transformations
-        transformations = self._extract_transformations(description)
+        transformations = self._extract_transformations(description, keywords)
         
         # Extract parameters
-        parameters = self._extract_parameters(description)
+        parameters = self._extract_parameters(description, keywords)
         
         # Validate mathematical consistency
-        self._validate_request(objects, transformations, parameters)
+        object_table = ObjectTable.from_objects(objects)
+        self._validate_request(object_table, transformations, parameters)
         
         return AnimationRequest(
             description=description,
             animation_type=animation_type,
             objects=objects,
             transformations=transformations,
-            parameters=parameters
+            parameters=parameters,
+            object_table=object_table
         )
     
-    def _detect_animation_type(self, text: str) -> AnimationType:
+    @staticmethod
+    def normalize(description: str) -> str:
+        """Normalize a description before parsing"""
+        return description.lower().strip()
+    
+    def _detect_animation_type(self, text: str, doc) -> AnimationType:
         """Detect the type of animation requested"""
-        for concept, patterns in self.concept_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    if "stereo" in concept or "mobius" in concept:
-                        return AnimationType.GEOMETRIC_TRANSFORM
-                    elif "gyro" in concept:
-                        return AnimationType.VECTOR_OPERATION
-                    elif "hyperbolic" in concept:
-                        return AnimationType.MANIFOLD_VISUALIZATION
+        # Keywords are one startswith() per token; only multi-word phrases
+        # need a regex scan. The first concept found, in priority order, wins.
+        keyword_hits = {
+            concept
+            for word in (token.lower_ for token in doc) if word.startswith(self._keyword_prefixes)
+            for keyword, concept in self.concept_keywords.items() if word.startswith(keyword)
+        }
+        for concept, animation_type in _CONCEPT_TYPES.items():
+            if concept in keyword_hits or any(p.search(text) for p in self.concept_patterns[concept]):
+                return animation_type
         
         return AnimationType.GEOMETRIC_TRANSFORM  # Default
     
-    def _extract_objects(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_objects(self, text: str, doc) -> List[Dict[str, Any]]:
         """Extract mathematical objects from text"""
         objects = []
         
-        # Parse with spaCy
-        doc = self.nlp(text)
-        
         # Extract based on patterns
         for obj_type, pattern in self.object_patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            matches = pattern.finditer(text)
             for match in matches:
                 obj = {
                     "type": obj_type,
@@ -132,28 +294,23 @@ class NLPAnimationParser:
                 # Parse vectors/points
                 if obj_type in ["vector", "point"]:
                     coords = self._parse_coordinates(match.group())
-                    if coords:
-                        obj["coordinates"] = coords
+                    if coords is not None:
+                        # Object dicts stay JSON-serializable; arrays live
+                        # only in the ObjectTable
+                        obj["coordinates"] = coords.tolist()
                 
                 objects.append(obj)
         
         return objects
     
-    def _extract_transformations(self, text: str) -> List[Dict[str, Any]]:
-        """Extract transformations to apply"""
+    def _extract_transformations(self, text: str, found: frozenset) -> List[Dict[str, Any]]:
+        """Extract transformations to apply, given the keywords found in text"""
         transformations = []
         
         # Check for each transformation type
-        transform_keywords = {
-            "rotation": ["rotate", "spin", "turn"],
-            "projection": ["project", "map"],
-            "translation": ["move", "shift", "translate"],
-            "scaling": ["scale", "resize", "zoom"]
-        }
-        
-        for transform_type, keywords in transform_keywords.items():
+        for transform_type, keywords in _TRANSFORM_KEYWORDS.items():
             for keyword in keywords:
-                if keyword in text:
+                if keyword in found:
                     # Extract parameters for this transformation
                     transform = {
                         "type": transform_type,
@@ -164,8 +321,8 @@ class NLPAnimationParser:
         
         return transformations
     
-    def _extract_parameters(self, text: str) -> Dict[str, Any]:
-        """Extract animation parameters"""
+    def _extract_parameters(self, text: str, found: frozenset) -> Dict[str, Any]:
+        """Extract animation parameters, given the keywords found in text"""
         params = {
             "duration": 3.0,  # Default
             "quality": "standard",
@@ -173,31 +330,33 @@ class NLPAnimationParser:
         }
         
         # Duration extraction
-        duration_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:second|sec)s?", text)
+        duration_match = _DURATION_RE.search(text)
         if duration_match:
             params["duration"] = float(duration_match.group(1))
         
         # Quality keywords
-        if any(word in text for word in ["4k", "high quality", "ultra"]):
-            params["quality"] = "4k"
-        elif "preview" in text or "quick" in text:
-            params["quality"] = "preview"
+        for quality, keywords in _QUALITY_KEYWORDS.items():
+            if not found.isdisjoint(keywords):
+                params["quality"] = quality
+                break
         
         # Style detection
-        if "artistic" in text or "beautiful" in text:
-            params["style"] = "artistic"
-        elif "minimal" in text or "simple" in text:
-            params["style"] = "minimalist"
+        for style, keywords in _STYLE_KEYWORDS.items():
+            if not found.isdisjoint(keywords):
+                params["style"] = style
+                break
         
         return params
     
-    def _parse_coordinates(self, coord_str: str) -> Optional[List[float]]:
+    def _parse_coordinates(self, coord_str: str) -> Optional[np.ndarray]:
         """Parse coordinate strings like '[0.3, 0.4, 0]'"""
         try:
-            # Remove brackets and parse
+            # Remove brackets and let NumPy convert every component in one
+            # call; like float(), it rejects malformed components outright,
+            # where np.fromstring would silently truncate
             coords = coord_str.strip("[]() ")
-            return [float(x.strip()) for x in coords.split(",")]
-        except:
+            return np.array(coords.split(","), dtype=np.float64)
+        except ValueError:
             return None
     
     def _extract_transform_params(self, text: str, keyword: str) -> Dict[str, Any]:
@@ -210,20 +369,20 @@ class NLPAnimationParser:
         
         # Extract angles for rotations
         if keyword in ["rotate", "spin", "turn"]:
-            angle_match = re.search(r"(\d+(?:\.\d+)?)\s*(?:degree|rad|°)", context)
+            angle_match = _ANGLE_RE.search(context)
             if angle_match:
                 params["angle"] = float(angle_match.group(1))
                 params["unit"] = "degrees" if "°" in angle_match.group() else "radians"
         
         # Extract reference objects
         if "relative to" in context or "around" in context:
-            ref_match = re.search(r"(?:relative to|around)\s+(?:the\s+)?(\w+)", context)
+            ref_match = _REF_RE.search(context)
             if ref_match:
                 params["reference"] = ref_match.group(1)
         
         return params
     
-    def _validate_request(self, objects: List[Dict], 
+    def _validate_request(self, objects: ObjectTable, 
                          transformations: List[Dict], 
                          parameters: Dict) -> None:
         """Validate mathematical consistency of request"""
@@ -231,16 +390,111 @@ class NLPAnimationParser:
         for transform in transformations:
             if transform["type"] == "stereographic_projection":
                 # Ensure we have a sphere object
-                sphere_objects = [o for o in objects if "sphere" in o["type"]]
-                if not sphere_objects:
+                if not (objects.types == "sphere").any():
                     raise ValueError("Stereographic projection requires a sphere object")
         
         # Validate vector dimensions
-        vectors = [o for o in objects if o["type"] == "vector"]
-        if vectors:
-            dimensions = [len(v.get("coordinates", [])) for v in vectors]
-            if dimensions and len(set(dimensions)) > 1:
-                raise ValueError("All vectors must have the same dimension")
+        dimensions = objects.dims[objects.types == "vector"]
+        if dimensions.size and (dimensions != dimensions[0]).any():
+            raise ValueError("All vectors must have the same dimension")
+
+
+# Manim code templates, built once at import
+_CODE_TEMPLATES: Dict[str, str] = {
+    "stereographic_projection": '''
+        # Stereographic projection setup
+        sphere = Sphere(radius=2, resolution=(30, 30))
+        sphere.set_color(BLUE_E)
+        
+        # Create projection plane
+        plane = Square(side_length=6).rotate(PI/2, RIGHT)
+        plane.shift(3*DOWN)
+        plane.set_fill(GRAY, opacity=0.3)
+        
+        # The projection itself is emitted with the transformations, as one
+        # vectorized pass over the sphere's points
+        ''',
+    
+    "gyrovector_addition": '''
+        # Gyrovector addition in Poincaré disk
+        disk = Circle(radius=3, color=WHITE)
+        
+        # JIT-compile the kernels when numba is installed; the loops below
+        # avoid np.dot/np.linalg, which numba can only compile with SciPy
+        try:
+            from numba import njit
+        except ImportError:
+            def njit(**options):
+                return lambda func: func
+        
+        # Convert to Poincaré disk coordinates
+        @njit(cache=True, fastmath=True)
+        def to_poincare(v):
+            norm_sq = 0.0
+            for i in range(v.shape[0]):
+                norm_sq += v[i] * v[i]
+            if norm_sq >= 1:
+                return 0.99 * v / np.sqrt(norm_sq)
+            return v
+        
+        # Gyroaddition formula, one fused pass per output component
+        @njit(cache=True, fastmath=True)
+        def gyro_add(u, v):
+            u_norm_sq = 0.0
+            v_norm_sq = 0.0
+            uv_dot = 0.0
+            for i in range(u.shape[0]):
+                u_norm_sq += u[i] * u[i]
+                v_norm_sq += v[i] * v[i]
+                uv_dot += u[i] * v[i]
+            
+            denominator = 1 + 2*uv_dot + u_norm_sq * v_norm_sq
+            coeff_u = (1 + 2*uv_dot + v_norm_sq) / denominator
+            coeff_v = (1 - u_norm_sq) / denominator
+            
+            result = np.empty(u.shape[0])
+            for i in range(u.shape[0]):
+                result[i] = coeff_u * u[i] + coeff_v * v[i]
+            return result
+        '''
+}
+
+
+def _sphere_code(name: str, obj: Dict[str, Any]) -> str:
+    """Manim code for a sphere object"""
+    return f"""
+        {name} = Sphere(radius=2, resolution=(30, 30))
+        {name}.set_color(BLUE_E)
+        self.add({name})
+        """
+
+
+def _vector_code(name: str, obj: Dict[str, Any]) -> str:
+    """Manim code for a vector object, drawn as an arrow to its coordinates"""
+    return f"""
+        {name}_coords = {obj["coordinates"]}
+        {name} = Arrow3D(ORIGIN, {name}_coords, color=YELLOW)
+        self.add({name})
+        """
+
+
+def _plane_code(name: str, obj: Dict[str, Any]) -> str:
+    """Manim code for a plane object"""
+    return f"""
+        {name} = Square(side_length=6).rotate(PI/2, RIGHT)
+        {name}.shift(3*DOWN)
+        {name}.set_fill(GRAY, opacity=0.3)
+        self.add({name})
+        """
+
+
+# Object type -> snippet renderer; other types emit no code. Every renderer
+# takes the same (name, obj) arguments, whether or not it reads obj
+_OBJECT_RENDERERS = {
+    "sphere": _sphere_code,
+    "vector": _vector_code,
+    "plane": _plane_code
+}
 
 
 class ManimCodeGenerator:
@@ -275,7 +529,7 @@ from math import *
 class GeneratedAnimation(ThreeDScene):
     def construct(self):
         {scene_code}
-        
+        {template}
         # Create objects
         {object_code}
         
@@ -290,50 +544,7 @@ class GeneratedAnimation(ThreeDScene):
     
     def _load_templates(self) -> Dict[str, str]:
         """Load Manim code templates"""
-        return {
-            "stereographic_projection": '''
-        # Stereographic projection setup
-        sphere = Sphere(radius=2, resolution=(30, 30))
-        sphere.set_color(BLUE_E)
-        
-        # Create projection plane
-        plane = Square(side_length=6).rotate(PI/2, RIGHT)
-        plane.shift(3*DOWN)
-        plane.set_fill(GRAY, opacity=0.3)
-        
-        # Projection mapping function
-        def stereo_project(point):
-            x, y, z = point
-            if z >= 0.99:  # Handle north pole
-                return np.array([0, 0, -3])
-            factor = 1 / (1 - z)
-            return np.array([factor * x, factor * y, -3])
-        ''',
-            
-            "gyrovector_addition": '''
-        # Gyrovector addition in Poincaré disk
-        disk = Circle(radius=3, color=WHITE)
-        
-        # Convert to Poincaré disk coordinates
-        def to_poincare(v):
-            norm = np.linalg.norm(v)
-            if norm >= 1:
-                return 0.99 * v / norm
-            return v
-        
-        # Gyroaddition formula
-        def gyro_add(u, v):
-            u_norm_sq = np.dot(u, u)
-            v_norm_sq = np.dot(v, v)
-            uv_dot = np.dot(u, v)
-            
-            denominator = 1 + 2*uv_dot + u_norm_sq * v_norm_sq
-            numerator_u = (1 + 2*uv_dot + v_norm_sq) * u
-            numerator_v = (1 - u_norm_sq) * v
-            
-            return (numerator_u + numerator_v) / denominator
-        '''
-        }
+        return dict(_CODE_TEMPLATES)
     
     def _select_template(self, request: AnimationRequest) -> str:
         """Select appropriate template based on request type"""
@@ -371,39 +582,12 @@ class GeneratedAnimation(ThreeDScene):
         """Generate code for creating objects"""
         object_code = []
         
+        # One dict dispatch per object instead of an if/elif chain
         for i, obj in enumerate(objects):
-            obj_name = f"obj_{i}"
-            
-            if obj["type"] == "sphere":
-                # Parse sphere notation (S², S³, etc.)
-                dimension = 3  # Default
-                if "S²" in obj["value"] or "S^2" in obj["value"]:
-                    dimension = 2
-                elif "S³" in obj["value"] or "S^3" in obj["value"]:
-                    dimension = 3
-                
-                object_code.append(f"""
-        {obj_name} = Sphere(radius=2, resolution=(30, 30))
-        {obj_name}.set_color(BLUE_E)
-        self.add({obj_name})
-        """)
-            
-            elif obj["type"] == "vector" and "coordinates" in obj:
-                coords = obj["coordinates"]
-                object_code.append(f"""
-        {obj_name}_coords = {coords}
-        {obj_name} = Arrow3D(ORIGIN, {obj_name}_coords, color=YELLOW)
-        self.add({obj_name})
-        """)
-            
-            elif obj["type"] == "plane":
-                plane_type = "polar" if "polar" in obj["value"] else "standard"
-                object_code.append(f"""
-        {obj_name} = Square(side_length=6).rotate(PI/2, RIGHT)
-        {obj_name}.shift(3*DOWN)
-        {obj_name}.set_fill(GRAY, opacity=0.3)
-        self.add({obj_name})
-        """)
+            render = _OBJECT_RENDERERS.get(obj["type"])
+            if render is None or (obj["type"] == "vector" and "coordinates" not in obj):
+                continue
+            object_code.append(render(f"obj_{i}", obj))
         
         return "\n".join(object_code)
     
@@ -432,11 +616,14 @@ class GeneratedAnimation(ThreeDScene):
             
             elif transform["type"] == "projection":
                 transform_code.append("""
-        # Stereographic projection animation
-        projected_points = []
-        for point in sphere.get_points():
-            projected = stereo_project(point)
-            projected_points.append(projected)
+        # Stereographic projection animation, over the whole (N, 3) point
+        # array at once; points at the north pole map to (0, 0, -3)
+        points = sphere.get_points()
+        z = points[:, 2]
+        factor = np.divide(1.0, 1.0 - z, out=np.zeros_like(z), where=z < 0.99)
+        projected_points = np.column_stack(
+            (factor * points[:, 0], factor * points[:, 1], np.full_like(z, -3.0))
+        )
         
         # Animate projection
         self.play(
@@ -444,7 +631,7 @@ class GeneratedAnimation(ThreeDScene):
                 Dot(point), 
                 Dot(projected)
             ) for point, projected in zip(
-                sphere.get_points()[::10], 
+                points[::10], 
                 projected_points[::10]
             )],
             run_time=4
@@ -493,18 +680,20 @@ class AnimationValidator:
         results = {}
         
         # Extract vectors from request
-        vectors = [obj for obj in request.objects if obj["type"] == "vector"]
-        
-        if len(vectors) >= 2 and all("coordinates" in v for v in vectors):
-            # Check if vectors are in valid range for gyrovector operations
-            for v in vectors:
-                norm = np.linalg.norm(v["coordinates"])
-                if norm >= 1:
-                    results["warnings"] = results.get("warnings", [])
-                    results["warnings"].append(
-                        f"Vector {v['coordinates']} has norm >= 1, "
-                        "not valid for Poincaré ball model"
-                    )
+        table = request.object_table or ObjectTable.from_objects(request.objects)
+        vectors = table.types == "vector"
+        
+        if vectors.sum() >= 2 and table.has_coords[vectors].all():
+            # Check if vectors are in valid range for gyrovector operations,
+            # all norms at once (zero padding leaves them unchanged)
+            norms = np.linalg.norm(table.coords[vectors], axis=1)
+            for i in np.flatnonzero(vectors)[norms >= 1]:
+                v = request.objects[i]
+                results["warnings"] = results.get("warnings", [])
+                results["warnings"].append(
+                    f"Vector {v['coordinates']} has norm >= 1, "
+                    "not valid for Poincaré ball model"
+                )
         
         return results
     
@@ -526,15 +715,12 @@ class AnimationValidator:
     
     def _check_numerical_stability(self, code: str) -> Dict[str, Any]:
         """Check for potential numerical instabilities"""
-        stability_issues = []
-        
-        # Check for division by small numbers
-        if "/ (1 -" in code and "0.99" not in code:
-            stability_issues.append("Division by (1-z) without bounds check")
-        
-        # Check for normalization of near-zero vectors
-        if "norm(" in code and "if norm" not in code:
-            stability_issues.append("Vector normalization without zero check")
+        # One scan finds every risky construct and every guard
+        found = {match.lastgroup for match in _STABILITY_RE.finditer(code)}
+        stability_issues = [
+            message for risk, (guard, message) in _STABILITY_RULES.items()
+            if risk in found and guard not in found
+        ]
         
         return {
             "stable": len(stability_issues) == 0,
@@ -542,6 +728,21 @@ class AnimationValidator:
         }
 
 
+@lru_cache(maxsize=None)
+def _pipeline_components() -> Tuple[NLPAnimationParser, ManimCodeGenerator, AnimationValidator]:
+    """Pipeline components shared by every request; none keep per-request state"""
+    return NLPAnimationParser(), ManimCodeGenerator(), AnimationValidator()
+
+
+def preload() -> None:
+    """Load the spaCy model and pipeline components ahead of the first request
+
+    Servers can call this at startup so no request pays the model load.
+    """
+    _pipeline_components()
+    NLPAnimationParser._get_nlp()
+
+
 # Main pipeline function
 def process_animation_request(description: str, 
                             validate: bool = True) -> Dict[str, Any]:
@@ -557,42 +758,88 @@ def process_animation_request(description: str,
         - manim_code: Generated Manim Python code
         - validation_report: Mathematical validation results
         - animation_request: Structured representation of request
-    """
-    # Initialize components
-    parser = NLPAnimationParser()
-    generator = ManimCodeGenerator()
-    validator = AnimationValidator()
     
+    Successful results are memoized per (description, validate); each call
+    gets its own copy, so callers may mutate it. Failures are not cached.
+    """
     try:
-        # Parse natural language
-        animation_request = parser.parse(description)
-        
-        # Generate Manim code
-        manim_code = generator.generate(animation_request)
-        
-        # Validate if requested
-        validation_report = {}
-        if validate:
-            validation_report = validator.validate(
-                animation_request, 
-                manim_code
-            )
-        
-        return {
-            "success": True,
-            "manim_code": manim_code,
-            "validation_report": validation_report,
-            "animation_request": animation_request.__dict__
-        }
-        
+        return copy.deepcopy(_process_cached(description, validate))
     except Exception as e:
-        return {
-            "success": False,
-            "error": str(e),
-            "manim_code": None,
-            "validation_report": {"error": str(e)},
-            "animation_request": None
+        return _failure_response(e)
+
+
+@lru_cache(maxsize=1024)
+def _process_cached(description: str, validate: bool) -> Dict[str, Any]:
+    """Shared result for one (description, validate); never handed out directly
+
+    Raises on failure, so lru_cache only ever stores successes.
+    """
+    parser, generator, validator = _pipeline_components()
+    return _build_response(parser, generator, validator, description, validate)
+
+
+def process_animation_requests(descriptions: List[str],
+                               validate: bool = True) -> List[Dict[str, Any]]:
+    """Batch version of process_animation_request
+
+    All descriptions are tokenized in one nlp.pipe pass.
+    """
+    parser, generator, validator = _pipeline_components()
+    docs = parser.nlp.pipe(parser.normalize(d) for d in descriptions)
+    return [
+        _run_request(parser, generator, validator, description, validate, doc)
+        for description, doc in zip(descriptions, docs)
+    ]
+
+
+def _run_request(parser: NLPAnimationParser, generator: ManimCodeGenerator,
+                 validator: AnimationValidator, description: str,
+                 validate: bool, doc=None) -> Dict[str, Any]:
+    """Parse, generate and validate one description"""
+    try:
+        return _build_response(parser, generator, validator, description, validate, doc)
+    except Exception as e:
+        return _failure_response(e)
+
+
+def _build_response(parser: NLPAnimationParser, generator: ManimCodeGenerator,
+                    validator: AnimationValidator, description: str,
+                    validate: bool, doc=None) -> Dict[str, Any]:
+    """Successful response for one description; raises on failure"""
+    # Parse natural language
+    animation_request = parser.parse(description, doc)
+    
+    # Generate Manim code
+    manim_code = generator.generate(animation_request)
+    
+    # Validate if requested
+    validation_report = {}
+    if validate:
+        validation_report = validator.validate(
+            animation_request, 
+            manim_code
+        )
+    
+    return {
+        "success": True,
+        "manim_code": manim_code,
+        "validation_report": validation_report,
+        # The object table is an internal view of "objects"
+        "animation_request": {
+            k: v for k, v in animation_request.__dict__.items() if k != "object_table"
         }
+    }
+
+
+def _failure_response(e: Exception) -> Dict[str, Any]:
+    """Response reporting a failed request"""
+    return {
+        "success": False,
+        "error": str(e),
+        "manim_code": None,
+        "validation_report": {"error": str(e)},
+        "animation_request": None
+    }
 
 
 # Example usage
@@ -604,13 +851,11 @@ if __name__ == "__main__":
         "Visualize a Möbius transformation on the complex plane with parameters a=1, b=2, c=3, d=4"
     ]
     
-    for example in examples:
+    for example, result in zip(examples, process_animation_requests(examples)):
         print(f"\n{'='*60}")
         print(f"Processing: {example}")
         print('='*60)
         
-        result = process_animation_request(example)
-        
         if result["success"]:
             print("✓ Successfully generated Manim code")
             print(f"Animation type: {result['animation_request']['animation_type']}")
@@ -58,6 +58,11 @@ class KimiK2Agent:
             logger.warning("Kimi K2 Agent initialized without groq client")
         self.session_history: List[Dict[str, Any]] = []
         
+    async def aclose(self):
+        """Close the client's HTTP connection pool"""
+        if self.client is not None:
+            await self.client.close()
+        
     async def query(
         self,
         prompt: str,
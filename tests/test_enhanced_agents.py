@@ -207,6 +207,57 @@ def test_integration_workflow():
     print("\n✓ Integrated workflow completed successfully")
 
 
+def test_objects_serialize_to_json():
+    """Extracted objects keep plain-list coordinates so responses stay JSON-serializable"""
+    
+    result = process_animation_request("Show gyroaddition of [0.3,0.4,0] and [0.1,0.2,0.5]")
+    assert result["success"], result.get("error")
+    
+    objects = result["animation_request"]["objects"]
+    vectors = [obj for obj in objects if obj["type"] == "vector"]
+    assert [v["coordinates"] for v in vectors] == [[0.3, 0.4, 0.0], [0.1, 0.2, 0.5]]
+    assert all(type(v["coordinates"]) is list for v in vectors)
+    json.dumps(objects)
+    print("✓ Objects serialize to JSON")
+
+
+def test_gyro_keyword_plurals():
+    """Inflected gyrovector keywords still select a vector operation"""
+    
+    result = process_animation_request("Show the gyrodistances between [0.1,0.2] and [0.3,0.1]")
+    assert result["success"], result.get("error")
+    assert "VECTOR_OPERATION" in str(result["animation_request"]["animation_type"])
+    print("✓ Plural gyrovector keywords detected")
+
+
+def test_failures_are_not_cached():
+    """A failed request is retried on the next call instead of served from the cache"""
+    
+    from src import nlp_manim_pipeline
+    
+    description = "Show gyroaddition of [0.3,0.4,0] and [0.1,0.2,0.5] after a transient error"
+    parser = nlp_manim_pipeline._pipeline_components()[0]
+    original_parse = parser.parse
+    
+    def failing_parse(*args, **kwargs):
+        raise RuntimeError("transient failure")
+    
+    parser.parse = failing_parse
+    try:
+        result = process_animation_request(description)
+    finally:
+        parser.parse = original_parse
+    assert not result["success"]
+    
+    result = process_animation_request(description)
+    assert result["success"], result.get("error")
+    
+    # Cached successes are copies: mutating one does not leak into the next
+    result["animation_request"]["objects"].clear()
+    assert process_animation_request(description)["animation_request"]["objects"]
+    print("✓ Failures are not cached")
+
+
 def main():
     """Run all tests"""
     
@@ -221,6 +272,11 @@ def main():
     # Test 3: Integration Workflow
     test_integration_workflow()
     
+    # Regression checks
+    test_objects_serialize_to_json()
+    test_gyro_keyword_plurals()
+    test_failures_are_not_cached()
+    
     print("\n" + "="*60)
     print("All tests completed!")
     print("="*60)
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script for the Manim GitHub searcher
+Checks parsing of web_search output and the search report built from it
+"""
+
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.manim_github_searcher import ManimGitHubSearcher
+
+SEARCH_OUTPUT = """
+Gyrovector scenes: https://github.com/alice/manim-gyro/blob/main/gyro.py
+Disk model: https://github.com/alice/manim-gyro/blob/main/disk.py
+Projection demos https://github.com/bob/stereo-manim
+Examples: https://github.com/bob/stereo-manim/tree/main/examples
+"""
+
+
+def test_unique_repositories():
+    """Results from the same repository count once in the search report"""
+
+    print("="*60)
+    print("Testing Search Report")
+    print("="*60)
+
+    searcher = ManimGitHubSearcher()
+    searcher.search_results = searcher.parse_search_results(SEARCH_OUTPUT)
+    report = searcher.generate_search_report()
+
+    assert report["total_results"] == 4
+    assert report["unique_repositories"] == 2
+    assert report["file_results"] == 2
+    assert report["repository_results"] == 1
+    assert sorted(report["top_repositories"]) == [
+        "https://github.com/alice/manim-gyro",
+        "https://github.com/bob/stereo-manim"
+    ]
+    print(f"✓ {report['total_results']} results from {report['unique_repositories']} repositories")
+
+
+def main():
+    """Run all tests"""
+
+    test_unique_repositories()
+
+    print("\n" + "="*60)
+    print("All tests completed!")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()